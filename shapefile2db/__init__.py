@@ -6,6 +6,7 @@ including validation and export functionality. It provides access to:
 - ShapeFileToDB: Class for validating and exporting shapefiles.
 - StateShapeFileToDB: Class for exporting shapefiles by state.
 - export_shapefile_to_db: Core function for exporting shapefile data to SQLite.
+- export_states_to_db: Parallel multi-state export, one database per state.
 
 Typical usage example:
     from shapefileexporter import ShapeFileToDB, export_shapefile_to_db
@@ -15,4 +16,4 @@ __version__ = "0.1.6"
 
 from shapefile2db.shape_file_exporter import ShapeFileToDB
 from shapefile2db.state_shape_file_exporter import StateShapeFileToDB
-from shapefile2db.core import export_shapefile_to_db
\ No newline at end of file
+from shapefile2db.core import export_shapefile_to_db, export_states_to_db
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Numeric kernels for coordinate decimation and rounding.
+
+Applies the exporter's `point_max` (downsampling) and `digit_max` (rounding)
+limits to whole coordinate arrays in single vectorized passes, instead of
+one Python-level round() call per point.
+"""
+
+import numpy as np
+
+
+def decimate_round(xy: np.ndarray, point_max: int, digit_max: int) -> np.ndarray:
+    """Downsamples and rounds an (N, 2) coordinate array in one pass.
+
+    Keeps every k-th point so the result stays under point_max entries, then
+    rounds both columns to digit_max decimal places. Both steps run as
+    vectorized NumPy operations over the full array.
+
+    Args:
+        xy: Coordinate array of shape (N, 2), dtype float64.
+        point_max: Maximum number of points to keep. If N <= point_max no
+            points are dropped.
+        digit_max: Number of decimal digits to keep per coordinate.
+
+    Returns:
+        np.ndarray: New (M, 2) float64 array with M <= max(point_max, 1)
+        points, rounded to digit_max digits.
+    """
+    n = xy.shape[0]
+    step = max(1, -(-n // point_max)) if point_max else 1
+    return np.round(xy[::step], digit_max)
+
+
+def range_mask(values: np.ndarray, lows: np.ndarray, highs: np.ndarray,
+               out: np.ndarray = None) -> np.ndarray:
+    """Tests which values fall inside any of a set of sorted closed ranges.
+
+    One binary-search pass locates the candidate range per value (the last
+    range starting at or below it) and one compare confirms the value is
+    under that range's end. The ranges MUST be disjoint: with overlapping
+    ranges the probe can land on a narrow range and never check a wider
+    containing one. Callers merge overlapping inputs first (see
+    StateShapeFileToDB.__init__).
+
+    Args:
+        values: int32 array of values to test.
+        lows: Range starts, sorted ascending, same length as highs.
+        highs: Range ends, aligned with lows.
+        out: Optional preallocated bool array to write the mask into.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the value lies in some range.
+    """
+    idx = np.searchsorted(lows, values, side='right') - 1
+    if out is None:
+        out = np.empty(values.shape[0], dtype=bool)
+    np.greater_equal(idx, 0, out=out)
+    out &= values <= highs[idx]
+    return out
+
+
+def prep_ring(xy: np.ndarray, digit_max: int):
+    """Rounds a ring, drops consecutive duplicates, and computes its bbox.
+
+    Fuses the per-ring preparation the exporter needs into vectorized
+    passes over the array: round to digit_max digits, mask out points that
+    became identical to their predecessor after rounding, and reduce the
+    surviving points to a bounding box. The bbox is taken from the rounded
+    array rather than shapely.bounds on the source ring so the stored
+    boundary rows agree exactly with the stored points.
+
+    Args:
+        xy: Ring coordinate array of shape (N, 2), columns (lon, lat).
+        digit_max: Number of decimal digits to keep per coordinate.
+
+    Returns:
+        tuple: (rounded (M, 2) float64 array with consecutive duplicates
+        removed, (min_lat, max_lat, min_lon, max_lon) bbox floats).
+    """
+    out = np.round(np.asarray(xy, dtype=np.float64), digit_max)
+    if out.shape[0] > 1:
+        keep = np.empty(out.shape[0], dtype=bool)
+        keep[0] = True
+        np.any(out[1:] != out[:-1], axis=1, out=keep[1:])
+        out = out[keep]
+    min_lon, min_lat = out.min(axis=0)
+    max_lon, max_lat = out.max(axis=0)
+    return out, (float(min_lat), float(max_lat), float(min_lon), float(max_lon))
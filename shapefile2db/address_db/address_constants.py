@@ -1,5 +1,9 @@
 # address_constants.py
 
+from types import MappingProxyType
+
+import numpy as np
+
 # zcta download link from us census bureau:
 # https://www2.census.gov/geo/tiger/TIGER2023/ZCTA5/
 ZCTA_LINK = "https://www.census.gov/cgi-bin/geo/shapefiles/index.php?year=2020&layergroup=ZIP%20Code%20Tabulation%20Areas"
@@ -61,6 +65,10 @@ STATE_DICT = {
     'DC': 'District of Columbia'
 }
 
+# VALID_STATES provides O(1) membership tests for two-letter state codes,
+# so callers can reject a bad abbreviation before any heavy shapefile work.
+VALID_STATES = frozenset(STATE_DICT)
+
 # STATE_ZIP_RANGES maps two-letter state abbreviations to a list of ZIP code ranges.
 # Each value is a list of tuples, where each tuple represents a ZIP code range
 # (start ZIP, end ZIP) associated with that state.
@@ -121,4 +129,76 @@ STATE_ZIP_RANGES = {
     'WI': [('53001', '54990')],
     'WV': [('24701', '26886')],
     'WY': [('82001', '83128')]
-}
\ No newline at end of file
+}
+
+# STATE_ZIP_RANGES_INT holds the same ranges pre-converted to ints, so hot
+# filter paths never repeat the string-to-int conversion per comparison.
+STATE_ZIP_RANGES_INT = MappingProxyType({
+    state: tuple((int(start), int(end)) for start, end in ranges)
+    for state, ranges in STATE_ZIP_RANGES.items()
+})
+
+# Freeze both tables as read-only mappings over tuples; they are shared
+# constants and should never be mutated by callers.
+STATE_DICT = MappingProxyType(STATE_DICT)
+STATE_ZIP_RANGES = MappingProxyType({
+    state: tuple(ranges) for state, ranges in STATE_ZIP_RANGES.items()
+})
+
+# Vectorized ZIP-to-state lookup tables, built once at import time.
+# The ranges above are flattened into parallel int32 arrays sorted by start
+# ZIP so membership tests become a single np.searchsorted probe instead of
+# a Python loop over ~80 string ranges per ZIP.
+_ZIP_RANGE_STARTS = np.fromiter(
+    (int(start) for ranges in STATE_ZIP_RANGES.values() for start, _ in ranges),
+    dtype=np.int32
+)
+_ZIP_RANGE_ENDS = np.fromiter(
+    (int(end) for ranges in STATE_ZIP_RANGES.values() for _, end in ranges),
+    dtype=np.int32
+)
+_ZIP_RANGE_STATES = np.array(
+    [state for state, ranges in STATE_ZIP_RANGES.items() for _ in ranges],
+    dtype='U2'
+)
+_zip_range_order = np.argsort(_ZIP_RANGE_STARTS, kind='stable')
+_ZIP_RANGE_STARTS = _ZIP_RANGE_STARTS[_zip_range_order]
+_ZIP_RANGE_ENDS = _ZIP_RANGE_ENDS[_zip_range_order]
+_ZIP_RANGE_STATES = _ZIP_RANGE_STATES[_zip_range_order]
+# Running maximum of the range ends: once this falls below a ZIP while
+# walking backwards from its candidate range, no earlier range can cover
+# it, so the walk can stop
+_ZIP_RANGE_MAX_ENDS = np.maximum.accumulate(_ZIP_RANGE_ENDS)
+
+
+def zip_to_state(zip_codes):
+    """Maps ZIP codes to two-letter state abbreviations in one vectorized pass.
+
+    Args:
+        zip_codes: Array-like of ZIP codes as ints (or anything castable to
+            int32, e.g. a pandas column of 5-digit strings via astype).
+
+    Returns:
+        np.ndarray: Array of 'U2' state abbreviations, '' where the ZIP does
+        not fall in any known range. Where ranges overlap (e.g. DC/MD/VA
+        around 20040), the covering range with the greatest start ZIP wins.
+    """
+    zips = np.asarray(zip_codes, dtype=np.int32)
+    states = np.full(zips.shape, '', dtype='U2')
+    # Start at the candidate range (the last one starting at or below the
+    # ZIP) and walk backwards until a range covers it or the running max
+    # of earlier range ends shows none can. Nested ranges like MD's
+    # 20331-20331 inside DC's 20042-20599 can sit several positions deep,
+    # so the walk cannot stop after a fixed number of steps.
+    probe = np.searchsorted(_ZIP_RANGE_STARTS, zips, side='right') - 1
+    active = probe >= 0
+    while np.any(active):
+        safe = np.where(active, probe, 0)
+        hit = active & (zips <= _ZIP_RANGE_ENDS[safe])
+        states[hit] = _ZIP_RANGE_STATES[safe[hit]]
+        active &= ~hit
+        probe -= 1
+        active &= probe >= 0
+        safe = np.where(active, probe, 0)
+        active &= _ZIP_RANGE_MAX_ENDS[safe] >= zips
+    return states
\ No newline at end of file
@@ -1,358 +1,1132 @@
-"""Provides access to the address.db SQLite database.
-
-Initializes the database engine, creates tables if the database file is missing,
-and handles connection setup using SQLAlchemy.
-
-Creates the db and tables for storing ZIP code and ZCTA data.
-
-Classes:
-    AddressDatabase: Manages connection and initialization of the address.db file.
-"""
-
-import os
-
-# SQLAlchemy imports
-from sqlalchemy import create_engine
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
-
-# Local imports
-from shapefile2db.address_db.address_models import ZipCode, ZCTA, ZCTAPoint, ZCTABoundary, Base
-
-# IO and console output
-from printpop import print_cyan, print_red, print_orange
-
-
-class AddressDatabase:
-    """Handles access to the address.db SQLite database.
-
-    Attributes:
-        DEFAULT_DB_PATH (str): Default relative path to the database file.
-        LABEL_JUST (int): Padding for console output labels.
-        engine (Engine): SQLAlchemy engine instance.
-        db_absolute_path (str): Absolute path to the database file.
-    """
-
-    DEFAULT_DB_PATH = 'address.db'
-    LABEL_JUST = 20
-
-    engine = None
-    db_absolute_path = None
-
-    
-    
-    def __init__(self, db_relative_path=DEFAULT_DB_PATH, db_absolute_path=None):
-        """Initializes the AddressDatabase instance.
-
-        If the database file does not exist, it will be created along with required tables.
-
-        Args:
-            db_relative_path (str): Relative path to the database file.
-            db_absolute_path (str, optional): Absolute path to the database file.
-
-        Raises:
-            ValueError: If path resolution fails.
-            FileNotFoundError: If the database file cannot be located.
-            SQLAlchemyError: If SQLAlchemy fails to initialize the engine or create tables.
-            Exception: For any other unexpected errors.
-        """
-        try:
-            # Resolve absolute path
-            if db_absolute_path is not None:
-                self.db_absolute_path = db_absolute_path
-            else:
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-                self.db_absolute_path = os.path.normpath(
-                    os.path.join(base_dir, db_relative_path)
-                )
-
-            # Check if database file exists
-            create_tables = False
-            if not os.path.exists(self.db_absolute_path):
-                print("Warning:".ljust(self.LABEL_JUST), end="", flush=True)
-                print_orange("Database file not found at: ", end="", flush=True)
-                print_cyan(f"'{self.db_absolute_path}'", flush=True)
-                create_tables = True
-
-            # Initialize SQLAlchemy engine
-            self.engine = create_engine(f"sqlite:///{self.db_absolute_path}")
-
-            # Create tables if needed
-            if create_tables:
-                Base.metadata.create_all(self.engine)
-                print("Warning:".ljust(self.LABEL_JUST), end="", flush=True)
-                print_orange("Database file created at: ", end="", flush=True)
-                print_cyan(f"'{self.db_absolute_path}'", flush=True)
-
-        except ValueError as ve:
-            print_red(f"ValueError occurred in AddressDatabase: {ve}")
-        except FileNotFoundError as fnfe:
-            print_red(f"FileNotFoundError occurred in AddressDatabase: {fnfe}")
-        except SQLAlchemyError as sae:
-            print_red(f"SQLAlchemyError occurred in AddressDatabase: {sae}")
-        except Exception as e:
-            print_red(f"Unexpected error in AddressDatabase: {type(e).__name__}: {e}")
-    
-
-
-    def add_zip(self, zip_code: str, zip_lat: float, zip_lon: float):
-        """Adds a new ZipCode record to the database.
-
-        Args:
-            zip_code: ZIP code as a string.
-            zip_lat: Latitude of the ZIP code.
-            zip_lon: Longitude of the ZIP code.
-
-        Returns:
-            ZipCode: The newly created ZipCode object, or None if failed.
-        """
-        session = None
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                new_zip = ZipCode(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
-                session.add(new_zip)
-                session.commit()
-                session.refresh(new_zip)
-                return new_zip
-        except (TypeError, ValueError) as model_error:
-            print_red(f"ValueError in add_zip(): {model_error}")
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in add_zip(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in add_zip(): {type(e).__name__}: {e}")
-        if session:
-            session.rollback()
-        return None
-
-    
-    
-    def get_zips(self, zip_code: str = None):
-        """Retrieves ZipCode records matching the given ZIP code.
-
-        Args:
-            zip_code: Optional ZIP code to filter by.
-
-        Returns:
-            List[ZipCode]: Matching ZipCode records, or all if no filter is provided.
-        """
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                query = session.query(ZipCode)
-                if zip_code:
-                    query = query.filter(ZipCode.zip_code == zip_code)
-                return query.all()
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in get_zips(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in get_zips(): {type(e).__name__}: {e}")
-        return []
-
-   
-   
-    def add_zcta(self, zip_code_id: int, interior: bool, multi: bool):
-        """Adds a new ZCTA record linked to a ZipCode.
-
-        Args:
-            zip_code_id: Foreign key ID of the ZipCode.
-            interior: Whether the ZCTA is interior.
-            multi: Whether the ZCTA is multi-part.
-
-        Returns:
-            ZCTA: The newly created ZCTA object, or None if failed.
-        """
-        session = None
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                new_zcta = ZCTA(zip_code_id=zip_code_id, interior=interior, multi=multi)
-                session.add(new_zcta)
-                session.commit()
-                session.refresh(new_zcta)
-                return new_zcta
-        except (TypeError, ValueError) as model_error:
-            print_red(f"ValueError in add_zcta(): {model_error}")
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in add_zcta(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in add_zcta(): {type(e).__name__}: {e}")
-        if session:
-            session.rollback()
-        return None
-
-    
-    
-    def get_zctas(self, zip_code_id: int):
-        """Retrieves all ZCTA records linked to a given ZipCode.
-
-        Args:
-            zip_code_id: Foreign key ID of the ZipCode.
-
-        Returns:
-            List[ZCTA]: Matching ZCTA records, or empty list if none found.
-        """
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                return session.query(ZCTA).filter(ZCTA.zip_code_id == zip_code_id).all()
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in get_zctas(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in get_zctas(): {type(e).__name__}: {e}")
-        return []
-
-    
-    
-    def add_all_zcta_points(self, zcta_id: int, zcta_points: list[tuple[float, float]]):
-        """Adds multiple ZCTAPoint records for a given ZCTA.
-
-        Args:
-            zcta_id: Foreign key ID of the ZCTA.
-            zcta_points: List of (longitude, latitude) tuples.
-            NOTE: IN SHAPEFILE LONGITUDE COMES FIRST THEN LATITUDE
-
-        Returns:
-            bool: True if successful, False otherwise.
-        """
-        session = None
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                # NOTE: longitude comes first in SHAPEFILE
-                for lon, lat  in zcta_points:
-                    new_point = ZCTAPoint(zcta_id=zcta_id, zcta_point_lat=lat, zcta_point_lon=lon)
-                    session.add(new_point)
-                session.commit()
-                return True
-        except (TypeError, ValueError) as model_error:
-            print_red(f"ValueError in add_all_zcta_points(): {model_error}")
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in add_all_zcta_points(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in add_all_zcta_points(): {type(e).__name__}: {e}")
-        if session:
-            session.rollback()
-        return False
-
-    
-    
-    def add_zcta_point(self, zcta_id: int, zcta_point_lat: float, zcta_point_lon: float):
-        """Adds a single ZCTAPoint record for a given ZCTA.
-
-        Args:
-            zcta_id: Foreign key ID of the ZCTA.
-            zcta_point_lat: Latitude of the point.
-            zcta_point_lon: Longitude of the point.
-
-        Returns:
-            ZCTAPoint: The newly created ZCTAPoint object, or None if failed.
-        """
-        session = None
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                new_point = ZCTAPoint(
-                    zcta_id=zcta_id,
-                    zcta_point_lat=zcta_point_lat,
-                    zcta_point_lon=zcta_point_lon
-                )
-                session.add(new_point)
-                session.commit()
-                session.refresh(new_point)
-                return new_point
-        except (TypeError, ValueError) as model_error:
-            print_red(f"ValueError in add_zcta_point(): {model_error}")
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in add_zcta_point(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in add_zcta_point(): {type(e).__name__}: {e}")
-        if session:
-            session.rollback()
-        return None
-    
-    
-
-    
-    
-    def get_zcta_points(self, zcta_id: int):
-        """Retrieves all ZCTAPoint records for a given ZCTA.
-
-        Args:
-            zcta_id: Foreign key ID of the ZCTA.
-
-        Returns:
-            List[ZCTAPoint]: Matching ZCTAPoint records, or empty list if none found.
-        """
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                return session.query(ZCTAPoint).filter(ZCTAPoint.zcta_id == zcta_id).all()
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in get_zcta_points(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in get_zcta_points(): {type(e).__name__}: {e}")
-        return []
-    
-
-    def add_zcta_boundary(self, zcta_id: int, 
-                                 min_lat: float, 
-                                 max_lat: float, 
-                                 min_lon: float, 
-                                 max_lon: float):
-        """Adds points defining boundary box around a zcta
-
-        Args:
-            zcta_id: Foreign key ID of the ZCTA.
-            min_lat: min latitude of boundary
-            max_lat: max latitude of boundary
-            min_lon: min longitude of boundary
-            max_lon: max longitude of boundary
-
-        Returns:
-            ZCTABoundary: The newly created ZCTABoundary object, or None if failed.
-        """
-        session = None
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                new_point = ZCTABoundary(
-                    zcta_id=zcta_id,
-                    min_lat = min_lat,
-                    max_lat = max_lat,
-                    min_lon = min_lon,
-                    max_lon = max_lon
-                )
-                session.add(new_point)
-                session.commit()
-                session.refresh(new_point)
-                return new_point
-        except (TypeError, ValueError) as model_error:
-            print_red(f"ValueError in add_zcta_boundary(): {model_error}")
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in add_zcta_boundary(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in add_zcta_boundary(): {type(e).__name__}: {e}")
-        if session:
-            session.rollback()
-        return None
-    
-    def get_zcta_boundary(self, zcta_id: int):
-        """get points defining boundary box around a zcta
-
-        Args:
-            zcta_id: Foreign key ID of the ZCTA.
-
-        Returns:
-            ZCTABoundary: The ZCTABoundary object, or None if failed.
-        """
-        try:
-            Session = sessionmaker(bind=self.engine)
-            with Session() as session:
-                return session.query(ZCTABoundary).filter(ZCTABoundary.zcta_id == zcta_id).all()
-        except SQLAlchemyError as db_error:
-            print_red(f"SQLAlchemyError in get_zcta_boundary(): {db_error}")
-        except Exception as e:
-            print_red(f"Unexpected error in get_zcta_boundary(): {type(e).__name__}: {e}")
-        return []
+"""Provides access to the address.db SQLite database.
+
+Initializes the database engine, creates tables if the database file is missing,
+and handles connection setup using SQLAlchemy.
+
+Creates the db and tables for storing ZIP code and ZCTA data.
+
+Classes:
+    AddressDatabase: Manages connection and initialization of the address.db file.
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+
+import numpy as np
+
+# SQLAlchemy imports
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+# Local imports
+from shapefile2db.address_db.address_models import ZipCode, ZCTA, ZCTAPoint, ZCTABoundary, Base
+
+# IO and console output
+from printpop import print_cyan, print_orange
+
+# Errors are logged lazily instead of printed so a bad shapefile producing
+# thousands of failures does not stall the import on colorized stdout writes
+log = logging.getLogger(__name__)
+
+
+class AddressDatabase:
+    """Handles access to the address.db SQLite database.
+
+    Attributes:
+        DEFAULT_DB_PATH (str): Default relative path to the database file.
+        LABEL_JUST (int): Padding for console output labels.
+        engine (Engine): SQLAlchemy engine instance.
+        db_absolute_path (str): Absolute path to the database file.
+    """
+
+    DEFAULT_DB_PATH = 'address.db'
+    LABEL_JUST = 20
+
+    # Parameterized point insert for the raw DBAPI fast path; reusing the
+    # identical string lets sqlite3 hit its internal statement cache
+    INSERT_POINT_SQL = (
+        "INSERT INTO zcta_points (zcta_id, zcta_point_lat, zcta_point_lon) "
+        "VALUES (?, ?, ?)"
+    )
+
+    # --- SQLite PRAGMA defaults ---
+    # WAL + NORMAL keeps commits cheap while staying durable. Bulk loaders can
+    # pass journal_mode='MEMORY', synchronous='OFF' for maximum insert speed.
+    DEFAULT_JOURNAL_MODE = 'WAL'
+    DEFAULT_SYNCHRONOUS = 'NORMAL'
+    DEFAULT_TEMP_STORE = 'MEMORY'
+    DEFAULT_CACHE_SIZE = -262144  # negative value is KiB, so 256 MiB page cache
+
+    # sqlite3 keeps prepared statements keyed by their exact SQL text; the
+    # default cache of 128 can thrash between the insert, index, and lookup
+    # statements during an export, forcing re-parse and re-plan
+    CACHED_STATEMENTS = 512
+
+    # Buffered point rows are flushed once the buffer reaches this size, so
+    # each executemany covers many rings' worth of inserts
+    POINT_BUFFER_MAX = 10_000
+
+    # Staged zip/zcta rows carry explicit pre-assigned ids, so they can
+    # accumulate and flush as executemany batches of this size
+    STAGE_BUFFER_MAX = 10_000
+
+    INSERT_ZIP_SQL = (
+        "INSERT INTO zip_codes (zip_code_id, zip_code, zip_lat, zip_lon) "
+        "VALUES (?, ?, ?, ?)"
+    )
+    INSERT_ZCTA_SQL = (
+        "INSERT INTO zctas (zcta_id, zip_code_id, interior, multi) "
+        "VALUES (?, ?, ?, ?)"
+    )
+
+    # Secondary lookup indexes by name. _ensure_indexes creates them on
+    # open; bulk_session drops and rebuilds them around large imports so
+    # inserts skip incremental B-tree maintenance. The DDL must match what
+    # the models declare — zip_code is unique, so its rebuilt index has to
+    # be UNIQUE too or the constraint silently disappears after an import
+    INDEX_DDL = {
+        "ix_zip_codes_zip_code": (
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_zip_codes_zip_code "
+            "ON zip_codes (zip_code)"
+        ),
+        "ix_zctas_zip_code_id": (
+            "CREATE INDEX IF NOT EXISTS ix_zctas_zip_code_id "
+            "ON zctas (zip_code_id)"
+        ),
+        "ix_zcta_points_zcta_id": (
+            "CREATE INDEX IF NOT EXISTS ix_zcta_points_zcta_id "
+            "ON zcta_points (zcta_id)"
+        ),
+        "ix_zcta_boundaries_zcta_id": (
+            "CREATE INDEX IF NOT EXISTS ix_zcta_boundaries_zcta_id "
+            "ON zcta_boundaries (zcta_id)"
+        ),
+    }
+
+    engine = None
+    Session = None
+    db_absolute_path = None
+
+
+
+    def __init__(self, db_relative_path=DEFAULT_DB_PATH, db_absolute_path=None,
+                 journal_mode=DEFAULT_JOURNAL_MODE,
+                 synchronous=DEFAULT_SYNCHRONOUS,
+                 temp_store=DEFAULT_TEMP_STORE,
+                 cache_size=DEFAULT_CACHE_SIZE,
+                 buffer_boundaries=False,
+                 buffer_points=False):
+        """Initializes the AddressDatabase instance.
+
+        If the database file does not exist, it will be created along with required tables.
+
+        Args:
+            db_relative_path (str): Relative path to the database file.
+            db_absolute_path (str, optional): Absolute path to the database file.
+            journal_mode (str): SQLite journal_mode PRAGMA (e.g. 'WAL', 'MEMORY').
+            synchronous (str): SQLite synchronous PRAGMA (e.g. 'NORMAL', 'OFF').
+            temp_store (str): SQLite temp_store PRAGMA.
+            cache_size (int): SQLite cache_size PRAGMA (negative means KiB).
+            buffer_boundaries (bool): If True, add_zcta_boundary buffers rows
+                in memory; call flush_boundaries() to write them in one batch.
+            buffer_points (bool): If True, add_all_zcta_points accumulates
+                rows across calls and writes them POINT_BUFFER_MAX at a time;
+                call flush_points() after the last ring to drain the buffer.
+
+        Raises:
+            ValueError: If path resolution fails.
+            FileNotFoundError: If the database file cannot be located.
+            SQLAlchemyError: If SQLAlchemy fails to initialize the engine or create tables.
+            Exception: For any other unexpected errors.
+        """
+        self.buffer_boundaries = buffer_boundaries
+        self._boundary_buffer = []
+        self.buffer_points = buffer_points
+        self._point_buffer = []
+        self._point_buffer_len = 0
+        self._bulk_session = None
+        self._zip_buffer = []
+        self._zcta_buffer = []
+        self._zip_ids = {}
+        self._next_zip_id = None
+        self._next_zcta_id = None
+        try:
+            # Resolve absolute path
+            if db_absolute_path is not None:
+                self.db_absolute_path = db_absolute_path
+            else:
+                base_dir = os.path.dirname(os.path.abspath(__file__))
+                self.db_absolute_path = os.path.normpath(
+                    os.path.join(base_dir, db_relative_path)
+                )
+
+            # Check if database file exists
+            create_tables = False
+            if not os.path.exists(self.db_absolute_path):
+                print("Warning:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_orange("Database file not found at: ", end="", flush=True)
+                print_cyan(f"'{self.db_absolute_path}'", flush=True)
+                create_tables = True
+
+            # Initialize SQLAlchemy engine. The hot-path methods reuse the
+            # exact same SQL strings (class-level INSERT_* constants), so a
+            # larger driver statement cache means each is parsed and planned
+            # once per connection.
+            self.engine = create_engine(
+                f"sqlite:///{self.db_absolute_path}",
+                connect_args={"cached_statements": self.CACHED_STATEMENTS}
+            )
+
+            # Apply PRAGMA tuning on every new DBAPI connection so commits do
+            # not pay the default fsync-and-journal cost on each small write
+            @event.listens_for(self.engine, "connect")
+            def _set_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+                cursor.execute(f"PRAGMA synchronous={synchronous}")
+                cursor.execute(f"PRAGMA temp_store={temp_store}")
+                cursor.execute(f"PRAGMA cache_size={cache_size}")
+                cursor.close()
+
+            # Build the session factory once; rebuilding it per call is pure
+            # overhead on bulk loads. expire_on_commit=False keeps returned
+            # objects readable after commit without a refresh SELECT.
+            self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+            # Create tables if needed
+            if create_tables:
+                Base.metadata.create_all(self.engine)
+                print("Warning:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_orange("Database file created at: ", end="", flush=True)
+                print_cyan(f"'{self.db_absolute_path}'", flush=True)
+            else:
+                # Existing database files predate the declared FK indexes;
+                # build them so get_* lookups stop scanning full tables
+                self._ensure_indexes()
+
+        except ValueError as ve:
+            log.error("ValueError occurred in AddressDatabase: %s", ve)
+        except FileNotFoundError as fnfe:
+            log.error("FileNotFoundError occurred in AddressDatabase: %s", fnfe)
+        except SQLAlchemyError as sae:
+            log.error("SQLAlchemyError occurred in AddressDatabase: %s", sae)
+        except Exception as e:
+            log.exception("Unexpected error in AddressDatabase")
+
+
+
+    def _ensure_indexes(self):
+        """Creates lookup indexes on databases built before they were declared.
+
+        Runs CREATE INDEX IF NOT EXISTS for each indexed column in the
+        models, so opening an older database file transparently upgrades it.
+        New databases get the same indexes from Base.metadata.create_all.
+        """
+        try:
+            with self.engine.begin() as conn:
+                # Databases written while the bulk rebuild used plain
+                # CREATE INDEX carry a non-unique ix_zip_codes_zip_code;
+                # drop it so the UNIQUE version below replaces it
+                existing = conn.exec_driver_sql(
+                    "SELECT sql FROM sqlite_master WHERE type = 'index' "
+                    "AND name = 'ix_zip_codes_zip_code'"
+                ).scalar_one_or_none()
+                if existing and 'UNIQUE' not in existing.upper():
+                    conn.exec_driver_sql(
+                        "DROP INDEX ix_zip_codes_zip_code"
+                    )
+                for index_ddl in self.INDEX_DDL.values():
+                    conn.exec_driver_sql(index_ddl)
+                # Older database files also predate the zcta_geom blob column
+                columns = {
+                    row[1] for row in
+                    conn.exec_driver_sql("PRAGMA table_info(zctas)")
+                }
+                if 'zcta_geom' not in columns:
+                    conn.exec_driver_sql(
+                        "ALTER TABLE zctas ADD COLUMN zcta_geom BLOB"
+                    )
+                if 'zcta_geom_scale' not in columns:
+                    conn.exec_driver_sql(
+                        "ALTER TABLE zctas ADD COLUMN zcta_geom_scale INTEGER"
+                    )
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in _ensure_indexes(): %s", db_error)
+
+
+
+    @staticmethod
+    def compute_bbox(points_xy):
+        """Computes a bounding box over an (N, 2) coordinate array.
+
+        Runs as two vectorized NumPy reductions in C instead of a Python
+        min/max loop over the points. Preferred input path for callers that
+        need the box passed to add_zcta_boundary.
+
+        Args:
+            points_xy: (N, 2) array-like of (longitude, latitude) points.
+            NOTE: IN SHAPEFILE LONGITUDE COMES FIRST THEN LATITUDE
+
+        Returns:
+            tuple: (min_lat, max_lat, min_lon, max_lon) as floats.
+        """
+        xy = np.asarray(points_xy, dtype=np.float64)
+        min_lon, min_lat = xy.min(axis=0)
+        max_lon, max_lat = xy.max(axis=0)
+        return (float(min_lat), float(max_lat), float(min_lon), float(max_lon))
+
+
+
+    @contextmanager
+    def bulk_session(self):
+        """Yields a single session for bulk imports, committed once on exit.
+
+        Use with the add_*_in methods so a whole shapefile export runs in one
+        transaction instead of one commit (and fsync) per row:
+
+            with db.bulk_session() as session:
+                zip_obj = db.add_zip_in(session, ...)
+                ...
+
+        Yields:
+            Session: An open session. Committed on normal exit, rolled back
+            if the block raises. While the block runs, buffered point and
+            boundary flushes write through this session's transaction (a
+            separate connection would deadlock against its write lock), and
+            any rows still buffered on exit are drained before the commit.
+            The secondary lookup indexes are dropped for the duration of
+            the block and rebuilt afterwards, so bulk inserts pay one
+            B-tree build at the end instead of index maintenance per row.
+        """
+        session = self.Session()
+        self._bulk_session = session
+        try:
+            # The drops ride in this transaction, so a rollback restores
+            # the indexes along with everything else
+            for index_name in self.INDEX_DDL:
+                session.connection().exec_driver_sql(
+                    f"DROP INDEX IF EXISTS {index_name}"
+                )
+            yield session
+            self.flush_staged()
+            self.flush_points()
+            self.flush_boundaries()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._bulk_session = None
+            session.close()
+            # Rebuild whatever the transaction outcome removed; IF NOT
+            # EXISTS makes this a no-op after a rollback
+            try:
+                with self.engine.begin() as conn:
+                    for index_ddl in self.INDEX_DDL.values():
+                        conn.exec_driver_sql(index_ddl)
+            except SQLAlchemyError as db_error:
+                log.error("SQLAlchemyError rebuilding indexes in bulk_session(): %s", db_error)
+
+
+
+    def add_zip_in(self, session, zip_code: str, zip_lat: float, zip_lon: float):
+        """Adds a ZipCode record using an externally-owned session.
+
+        Does not commit and does not catch errors; the caller (typically
+        bulk_session) owns the transaction and rolls back once on failure,
+        keeping this hot path free of per-row exception-frame setup. The row
+        is flushed so the autoincrement PK is populated.
+
+        Args:
+            session: An open session owned by the caller.
+            zip_code: ZIP code as a string.
+            zip_lat: Latitude of the ZIP code.
+            zip_lon: Longitude of the ZIP code.
+
+        Returns:
+            ZipCode: The newly created ZipCode object.
+        """
+        new_zip = ZipCode(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
+        session.add(new_zip)
+        session.flush()
+        return new_zip
+
+
+
+    def add_zip(self, zip_code: str, zip_lat: float, zip_lon: float):
+        """Adds a new ZipCode record to the database.
+
+        Args:
+            zip_code: ZIP code as a string.
+            zip_lat: Latitude of the ZIP code.
+            zip_lon: Longitude of the ZIP code.
+
+        Returns:
+            ZipCode: The newly created ZipCode object, or None if failed.
+        """
+        try:
+            # Single Core INSERT ... RETURNING skips the ORM identity map,
+            # unit-of-work flush, and post-commit refresh SELECT
+            table = ZipCode.__table__
+            with self.engine.begin() as conn:
+                pk = conn.execute(
+                    table.insert()
+                    .values(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
+                    .returning(table.c.zip_code_id)
+                ).scalar_one()
+            new_zip = ZipCode(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
+            new_zip.zip_code_id = pk
+            return new_zip
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_zip(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_zip(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_zip()")
+        return None
+
+    
+    
+    def get_zips(self, zip_code: str = None):
+        """Retrieves ZipCode records matching the given ZIP code.
+
+        Args:
+            zip_code: Optional ZIP code to filter by.
+
+        Returns:
+            List[ZipCode]: Matching ZipCode records, or all if no filter is provided.
+        """
+        try:
+            with self.Session() as session:
+                query = session.query(ZipCode)
+                if zip_code:
+                    query = query.filter(ZipCode.zip_code == zip_code)
+                return query.all()
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zips(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zips()")
+        return []
+
+   
+   
+    def add_zcta_in(self, session, zip_code_id: int, interior: bool, multi: bool):
+        """Adds a ZCTA record using an externally-owned session.
+
+        Does not commit and does not catch errors; the caller (typically
+        bulk_session) owns the transaction and rolls back once on failure,
+        keeping this hot path free of per-row exception-frame setup. The row
+        is flushed so the autoincrement PK is populated.
+
+        Args:
+            session: An open session owned by the caller.
+            zip_code_id: Foreign key ID of the ZipCode.
+            interior: Whether the ZCTA is interior.
+            multi: Whether the ZCTA is multi-part.
+
+        Returns:
+            ZCTA: The newly created ZCTA object.
+        """
+        new_zcta = ZCTA(zip_code_id=zip_code_id, interior=interior, multi=multi)
+        session.add(new_zcta)
+        session.flush()
+        return new_zcta
+
+
+
+    def add_zcta(self, zip_code_id: int, interior: bool, multi: bool):
+        """Adds a new ZCTA record linked to a ZipCode.
+
+        Args:
+            zip_code_id: Foreign key ID of the ZipCode.
+            interior: Whether the ZCTA is interior.
+            multi: Whether the ZCTA is multi-part.
+
+        Returns:
+            ZCTA: The newly created ZCTA object, or None if failed.
+        """
+        try:
+            # Single Core INSERT ... RETURNING skips the ORM identity map,
+            # unit-of-work flush, and post-commit refresh SELECT
+            table = ZCTA.__table__
+            with self.engine.begin() as conn:
+                pk = conn.execute(
+                    table.insert()
+                    .values(zip_code_id=zip_code_id, interior=interior, multi=multi)
+                    .returning(table.c.zcta_id)
+                ).scalar_one()
+            new_zcta = ZCTA(zip_code_id=zip_code_id, interior=interior, multi=multi)
+            new_zcta.zcta_id = pk
+            return new_zcta
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_zcta(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_zcta(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_zcta()")
+        return None
+
+    
+    
+    def get_zctas(self, zip_code_id: int):
+        """Retrieves all ZCTA records linked to a given ZipCode.
+
+        Args:
+            zip_code_id: Foreign key ID of the ZipCode.
+
+        Returns:
+            List[ZCTA]: Matching ZCTA records, or empty list if none found.
+        """
+        try:
+            with self.Session() as session:
+                return session.query(ZCTA).filter(ZCTA.zip_code_id == zip_code_id).all()
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zctas(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zctas()")
+        return []
+
+
+
+    def _init_stage_counters(self):
+        """Seeds the pre-assigned id counters and known-ZIP map from the db.
+
+        Runs once, lazily, before the first staged insert: loads the
+        zip_code -> zip_code_id map (so re-exports reuse existing rows) and
+        the next free id for each staged table.
+        """
+        with self.engine.connect() as conn:
+            self._zip_ids = {
+                zip_code: zip_id
+                for zip_code, zip_id in conn.exec_driver_sql(
+                    "SELECT zip_code, zip_code_id FROM zip_codes"
+                )
+            }
+            self._next_zip_id = conn.exec_driver_sql(
+                "SELECT COALESCE(MAX(zip_code_id), 0) + 1 FROM zip_codes"
+            ).scalar_one()
+            self._next_zcta_id = conn.exec_driver_sql(
+                "SELECT COALESCE(MAX(zcta_id), 0) + 1 FROM zctas"
+            ).scalar_one()
+
+
+
+    def stage_zip(self, zip_code: str, zip_lat: float, zip_lon: float) -> int:
+        """Stages a ZipCode row for batched insert and returns its id.
+
+        Ids are assigned from a Python counter instead of reading back the
+        autoincrement value, so no per-row INSERT or SELECT is issued; rows
+        accumulate and are written by flush_staged(). If the ZIP code is
+        already in the database its existing id is returned and nothing is
+        staged.
+
+        Args:
+            zip_code: ZIP code as a string.
+            zip_lat: Latitude of the ZIP code.
+            zip_lon: Longitude of the ZIP code.
+
+        Returns:
+            int: The pre-assigned (or existing) zip_code_id.
+        """
+        if self._next_zip_id is None:
+            self._init_stage_counters()
+        existing = self._zip_ids.get(zip_code)
+        if existing is not None:
+            return existing
+        zip_id = self._next_zip_id
+        self._next_zip_id += 1
+        self._zip_ids[zip_code] = zip_id
+        self._zip_buffer.append((zip_id, zip_code, zip_lat, zip_lon))
+        return zip_id
+
+
+
+    def stage_zcta(self, zip_code_id: int, interior: bool, multi: bool) -> int:
+        """Stages a ZCTA row for batched insert and returns its id.
+
+        Same pre-assigned-id scheme as stage_zip: no per-row round-trip, the
+        row is written by flush_staged(). The buffer auto-flushes once it
+        reaches STAGE_BUFFER_MAX rows.
+
+        Args:
+            zip_code_id: Foreign key ID of the ZipCode (staged or existing).
+            interior: Whether the ZCTA is interior.
+            multi: Whether the ZCTA is multi-part.
+
+        Returns:
+            int: The pre-assigned zcta_id.
+        """
+        if self._next_zcta_id is None:
+            self._init_stage_counters()
+        zcta_id = self._next_zcta_id
+        self._next_zcta_id += 1
+        self._zcta_buffer.append((zcta_id, zip_code_id, interior, multi))
+        if len(self._zcta_buffer) >= self.STAGE_BUFFER_MAX:
+            self.flush_staged()
+        return zcta_id
+
+
+
+    def flush_staged(self):
+        """Writes all staged zip and zcta rows in two executemany batches.
+
+        Called automatically when the zcta buffer fills and when a bulk
+        session exits; call it before a manual checkpoint commit so the
+        staged rows land in that transaction.
+
+        Returns:
+            bool: True if the buffers were written (or empty), False on error.
+        """
+        if not self._zip_buffer and not self._zcta_buffer:
+            return True
+        try:
+            if self._bulk_session is not None:
+                # Write inside the open bulk transaction; the session owner
+                # commits
+                conn = self._bulk_session.connection()
+                if self._zip_buffer:
+                    conn.exec_driver_sql(self.INSERT_ZIP_SQL, self._zip_buffer)
+                if self._zcta_buffer:
+                    conn.exec_driver_sql(self.INSERT_ZCTA_SQL, self._zcta_buffer)
+            else:
+                raw = self.engine.raw_connection()
+                try:
+                    cursor = raw.cursor()
+                    if self._zip_buffer:
+                        cursor.executemany(self.INSERT_ZIP_SQL, self._zip_buffer)
+                    if self._zcta_buffer:
+                        cursor.executemany(self.INSERT_ZCTA_SQL, self._zcta_buffer)
+                    raw.commit()
+                    cursor.close()
+                finally:
+                    raw.close()
+            self._zip_buffer.clear()
+            self._zcta_buffer.clear()
+            return True
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in flush_staged(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in flush_staged()")
+        return False
+
+
+
+    def add_all_zcta_points_in(self, session, zcta_id: int, zcta_points: list[tuple[float, float]]):
+        """Adds multiple ZCTAPoint records using an externally-owned session.
+
+        Does not commit and does not catch errors; the caller (typically
+        bulk_session) owns the transaction and rolls back once on failure,
+        keeping this hot path free of per-row exception-frame setup.
+
+        Args:
+            session: An open session owned by the caller.
+            zcta_id: Foreign key ID of the ZCTA.
+            zcta_points: List of (longitude, latitude) tuples, or an (N, 2)
+                NumPy float array with longitude in column 0.
+            NOTE: IN SHAPEFILE LONGITUDE COMES FIRST THEN LATITUDE
+
+        Returns:
+            bool: True if successful.
+        """
+        # NOTE: longitude comes first in SHAPEFILE
+        # Build plain row dicts and bulk insert in one statement so each
+        # point skips the per-object ORM unit-of-work overhead
+        if isinstance(zcta_points, np.ndarray):
+            # tolist() converts whole columns to plain floats in C,
+            # avoiding a NumPy scalar box per coordinate
+            rows = [
+                {"zcta_id": zcta_id, "zcta_point_lat": lat, "zcta_point_lon": lon}
+                for lon, lat in zip(zcta_points[:, 0].tolist(), zcta_points[:, 1].tolist())
+            ]
+        else:
+            rows = [
+                {"zcta_id": zcta_id, "zcta_point_lat": lat, "zcta_point_lon": lon}
+                for lon, lat in zcta_points
+            ]
+        if rows:
+            session.execute(ZCTAPoint.__table__.insert(), rows)
+        return True
+
+
+
+    def add_all_zcta_points(self, zcta_id: int, zcta_points: list[tuple[float, float]] = None,
+                            lats=None, lons=None):
+        """Adds multiple ZCTAPoint records for a given ZCTA.
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+            zcta_points: List of (longitude, latitude) tuples, or an (N, 2)
+                NumPy float array with longitude in column 0.
+            lats: Optional packed latitude sequence (e.g. array.array('d')).
+                Must be passed together with lons instead of zcta_points.
+            lons: Optional packed longitude sequence, parallel to lats.
+            NOTE: IN SHAPEFILE LONGITUDE COMES FIRST THEN LATITUDE
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        session = None
+        try:
+            # In buffered mode just collect the ring as one (zcta_id, array)
+            # entry — no per-point tuples exist until flush_points() streams
+            # them into executemany POINT_BUFFER_MAX points at a time
+            if self.buffer_points:
+                if lats is not None and lons is not None:
+                    xy = np.column_stack((
+                        np.asarray(lons, dtype=np.float64),
+                        np.asarray(lats, dtype=np.float64)
+                    ))
+                else:
+                    xy = np.asarray(zcta_points, dtype=np.float64)
+                if len(xy):
+                    self._point_buffer.append((zcta_id, xy))
+                    self._point_buffer_len += len(xy)
+                if self._point_buffer_len >= self.POINT_BUFFER_MAX:
+                    return self.flush_points()
+                return True
+            if lats is not None and lons is not None:
+                # Raw DBAPI executemany fed by a generator: no row list is
+                # materialized and each parameter tuple exists only briefly
+                raw = self.engine.raw_connection()
+                try:
+                    cursor = raw.cursor()
+                    cursor.executemany(
+                        self.INSERT_POINT_SQL,
+                        ((zcta_id, lats[i], lons[i]) for i in range(len(lats)))
+                    )
+                    raw.commit()
+                    cursor.close()
+                finally:
+                    raw.close()
+                return True
+            with self.Session() as session:
+                result = self.add_all_zcta_points_in(session, zcta_id=zcta_id, zcta_points=zcta_points)
+                session.commit()
+                return result
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_all_zcta_points(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_all_zcta_points(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_all_zcta_points()")
+        if session:
+            session.rollback()
+        return False
+
+
+
+    def flush_points(self):
+        """Writes all buffered point rows in one executemany batch.
+
+        Used with buffer_points=True: add_all_zcta_points accumulates rows
+        across rings and this method drains them through a single raw DBAPI
+        executemany inside one transaction, so each commit (and fsync) is
+        amortized over up to POINT_BUFFER_MAX inserts. Called automatically
+        when the buffer fills; call it once more after the last ring.
+
+        Returns:
+            bool: True if the buffer was written (or empty), False on error.
+        """
+        if not self._point_buffer:
+            return True
+        try:
+            # Stream (zcta_id, lat, lon) tuples out of the buffered arrays;
+            # each parameter tuple is built once and discarded by the driver
+            rows = (
+                (zcta_id, lat, lon)
+                for zcta_id, xy in self._point_buffer
+                for lon, lat in zip(xy[:, 0].tolist(), xy[:, 1].tolist())
+            )
+            if self._bulk_session is not None:
+                # Write through the bulk session's own DBAPI connection so
+                # the rows join its open transaction (a separate connection
+                # would deadlock on the write lock); the session owner
+                # commits
+                cursor = self._bulk_session.connection().connection.cursor()
+                cursor.executemany(self.INSERT_POINT_SQL, rows)
+                cursor.close()
+            else:
+                raw = self.engine.raw_connection()
+                try:
+                    cursor = raw.cursor()
+                    cursor.executemany(self.INSERT_POINT_SQL, rows)
+                    raw.commit()
+                    cursor.close()
+                finally:
+                    raw.close()
+            self._point_buffer.clear()
+            self._point_buffer_len = 0
+            return True
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in flush_points(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in flush_points()")
+        return False
+
+
+
+    def add_zcta_point(self, zcta_id: int, zcta_point_lat: float, zcta_point_lon: float):
+        """Adds a single ZCTAPoint record for a given ZCTA.
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+            zcta_point_lat: Latitude of the point.
+            zcta_point_lon: Longitude of the point.
+
+        Returns:
+            ZCTAPoint: The newly created ZCTAPoint object, or None if failed.
+        """
+        try:
+            # Single Core INSERT ... RETURNING skips the ORM identity map,
+            # unit-of-work flush, and post-commit refresh SELECT
+            table = ZCTAPoint.__table__
+            with self.engine.begin() as conn:
+                pk = conn.execute(
+                    table.insert()
+                    .values(
+                        zcta_id=zcta_id,
+                        zcta_point_lat=zcta_point_lat,
+                        zcta_point_lon=zcta_point_lon
+                    )
+                    .returning(table.c.zcta_point_id)
+                ).scalar_one()
+            new_point = ZCTAPoint(
+                zcta_id=zcta_id,
+                zcta_point_lat=zcta_point_lat,
+                zcta_point_lon=zcta_point_lon
+            )
+            new_point.zcta_point_id = pk
+            return new_point
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_zcta_point(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_zcta_point(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_zcta_point()")
+        return None
+    
+    
+
+    
+    
+    def get_zcta_points(self, zcta_id: int):
+        """Retrieves all ZCTAPoint records for a given ZCTA.
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+
+        Returns:
+            List[ZCTAPoint]: Matching ZCTAPoint records, or empty list if none found.
+        """
+        try:
+            with self.Session() as session:
+                return session.query(ZCTAPoint).filter(ZCTAPoint.zcta_id == zcta_id).all()
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zcta_points(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zcta_points()")
+        return []
+    
+
+    def add_zcta_bundle(self, zip_code_id: int, interior: bool, multi: bool,
+                        points_xy, store_geom_blob: bool = False,
+                        quantize_digits: int = None):
+        """Adds a ZCTA, its points, and its bounding box in one transaction.
+
+        Replaces the add_zcta / add_all_zcta_points / add_zcta_boundary
+        sequence (three commits) with a single Core transaction, computing
+        the bounding box with NumPy reductions over the coordinate array.
+
+        Args:
+            zip_code_id: Foreign key ID of the ZipCode.
+            interior: Whether the ZCTA is interior.
+            multi: Whether the ZCTA is multi-part.
+            points_xy: (N, 2) array-like of (longitude, latitude) points.
+            store_geom_blob: If True, pack the whole ring into the zcta_geom
+                blob column as little-endian float64 pairs (one row) instead
+                of inserting N zcta_points rows. Decode with get_zcta_geom.
+            quantize_digits: If set (with store_geom_blob), store the blob
+                as int32 coordinates scaled by 10**quantize_digits instead
+                of float64 — half the bytes for lat/lon precision that only
+                carries digit_max fractional digits anyway. The scale is
+                recorded in zcta_geom_scale and get_zcta_geom undoes it.
+            NOTE: IN SHAPEFILE LONGITUDE COMES FIRST THEN LATITUDE
+
+        Returns:
+            int: The new zcta_id, or None if failed.
+        """
+        try:
+            xy = np.asarray(points_xy, dtype=np.float64)
+            min_lat, max_lat, min_lon, max_lon = self.compute_bbox(xy)
+
+            geom_blob = None
+            geom_scale = None
+            if store_geom_blob:
+                if quantize_digits is not None:
+                    geom_scale = 10 ** quantize_digits
+                    geom_blob = np.round(xy * geom_scale).astype('<i4').tobytes()
+                else:
+                    geom_blob = np.ascontiguousarray(xy, dtype='<f8').tobytes()
+
+            zcta_table = ZCTA.__table__
+            with self.engine.begin() as conn:
+                zcta_id = conn.execute(
+                    zcta_table.insert()
+                    .values(zip_code_id=zip_code_id, interior=interior,
+                            multi=multi, zcta_geom=geom_blob,
+                            zcta_geom_scale=geom_scale)
+                    .returning(zcta_table.c.zcta_id)
+                ).scalar_one()
+                if not store_geom_blob:
+                    conn.execute(
+                        ZCTAPoint.__table__.insert(),
+                        [
+                            {"zcta_id": zcta_id, "zcta_point_lat": lat, "zcta_point_lon": lon}
+                            for lon, lat in zip(xy[:, 0].tolist(), xy[:, 1].tolist())
+                        ]
+                    )
+                conn.execute(
+                    ZCTABoundary.__table__.insert().values(
+                        zcta_id=zcta_id,
+                        min_lat=min_lat,
+                        max_lat=max_lat,
+                        min_lon=min_lon,
+                        max_lon=max_lon
+                    )
+                )
+            return zcta_id
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_zcta_bundle(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_zcta_bundle(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_zcta_bundle()")
+        return None
+
+
+
+    def get_zcta_geom(self, zcta_id: int):
+        """Decodes a ZCTA's packed geometry blob into an (N, 2) array.
+
+        Counterpart to add_zcta_bundle(..., store_geom_blob=True): one
+        np.frombuffer allocation recovers the full lon/lat ring instead of
+        hydrating N point rows. Quantized int32 blobs (zcta_geom_scale set)
+        are rescaled back to float degrees transparently.
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+
+        Returns:
+            np.ndarray: (N, 2) float64 array of (longitude, latitude) points,
+            or None if the ZCTA has no stored blob or on error.
+        """
+        try:
+            table = ZCTA.__table__
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(table.c.zcta_geom, table.c.zcta_geom_scale)
+                    .where(table.c.zcta_id == zcta_id)
+                ).one_or_none()
+            if row is None or row[0] is None:
+                return None
+            blob, scale = row
+            if scale:
+                return np.frombuffer(blob, dtype='<i4').reshape(-1, 2) / scale
+            return np.frombuffer(blob, dtype='<f8').reshape(-1, 2)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zcta_geom(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zcta_geom()")
+        return None
+
+
+
+    def get_zcta_points_array(self, zcta_id: int):
+        """Retrieves all points for a ZCTA as a structured NumPy array.
+
+        Streams plain (lat, lon) tuples from a Core SELECT in 10k-row chunks
+        instead of hydrating one ORM object per point, so dense ZCTAs with
+        100k+ points do not blow up memory. Prefer this over get_zcta_points
+        for numeric work.
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+
+        Returns:
+            np.ndarray: Structured array with 'lat' and 'lon' float64 fields,
+            empty if none found or on error.
+        """
+        point_dtype = np.dtype([('lat', 'f8'), ('lon', 'f8')])
+        try:
+            table = ZCTAPoint.__table__
+            stmt = (
+                select(table.c.zcta_point_lat, table.c.zcta_point_lon)
+                .where(table.c.zcta_id == zcta_id)
+            )
+            with self.engine.connect() as conn:
+                result = conn.execution_options(yield_per=10_000).execute(stmt)
+                # Unpack Row objects into plain tuples for the structured dtype
+                return np.fromiter(
+                    ((lat, lon) for lat, lon in result), dtype=point_dtype
+                )
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zcta_points_array(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zcta_points_array()")
+        return np.empty(0, dtype=point_dtype)
+
+
+    def add_zcta_boundary_in(self, session, zcta_id: int,
+                                    min_lat: float,
+                                    max_lat: float,
+                                    min_lon: float,
+                                    max_lon: float):
+        """Adds a ZCTABoundary record using an externally-owned session.
+
+        Does not commit and does not catch errors; the caller (typically
+        bulk_session) owns the transaction and rolls back once on failure,
+        keeping this hot path free of per-row exception-frame setup.
+
+        Args:
+            session: An open session owned by the caller.
+            zcta_id: Foreign key ID of the ZCTA.
+            min_lat: min latitude of boundary
+            max_lat: max latitude of boundary
+            min_lon: min longitude of boundary
+            max_lon: max longitude of boundary
+
+        Returns:
+            ZCTABoundary: The newly created ZCTABoundary object.
+        """
+        new_point = ZCTABoundary(
+            zcta_id=zcta_id,
+            min_lat = min_lat,
+            max_lat = max_lat,
+            min_lon = min_lon,
+            max_lon = max_lon
+        )
+        session.add(new_point)
+        session.flush()
+        return new_point
+
+
+
+    def add_zcta_boundary(self, zcta_id: int,
+                                 min_lat: float,
+                                 max_lat: float,
+                                 min_lon: float,
+                                 max_lon: float):
+        """Adds points defining boundary box around a zcta
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+            min_lat: min latitude of boundary
+            max_lat: max latitude of boundary
+            min_lon: min longitude of boundary
+            max_lon: max longitude of boundary
+
+        Returns:
+            ZCTABoundary: The newly created ZCTABoundary object, or None if
+            failed or when rows are being buffered (see flush_boundaries).
+        """
+        # In buffered mode just collect the row; flush_boundaries() writes
+        # the whole batch with one executemany-style insert
+        if self.buffer_boundaries:
+            self._boundary_buffer.append(
+                (zcta_id, min_lat, max_lat, min_lon, max_lon)
+            )
+            return None
+        try:
+            # Single Core INSERT ... RETURNING skips the ORM identity map,
+            # unit-of-work flush, and post-commit refresh SELECT
+            table = ZCTABoundary.__table__
+            with self.engine.begin() as conn:
+                pk = conn.execute(
+                    table.insert()
+                    .values(
+                        zcta_id=zcta_id,
+                        min_lat=min_lat,
+                        max_lat=max_lat,
+                        min_lon=min_lon,
+                        max_lon=max_lon
+                    )
+                    .returning(table.c.zcta_boundary_id)
+                ).scalar_one()
+            new_point = ZCTABoundary(
+                zcta_id=zcta_id,
+                min_lat=min_lat,
+                max_lat=max_lat,
+                min_lon=min_lon,
+                max_lon=max_lon
+            )
+            new_point.zcta_boundary_id = pk
+            return new_point
+        except (TypeError, ValueError) as model_error:
+            log.error("ValueError in add_zcta_boundary(): %s", model_error)
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in add_zcta_boundary(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in add_zcta_boundary()")
+        return None
+    
+    def flush_boundaries(self):
+        """Writes all buffered boundary rows in one bulk insert.
+
+        Used with buffer_boundaries=True: add_zcta_boundary accumulates rows
+        in memory and this method flushes them with a single executemany-style
+        insert, amortizing commit overhead across the whole batch. Call it at
+        natural batch boundaries (e.g. after each state, or after the export
+        loop).
+
+        Returns:
+            bool: True if the buffer was written (or empty), False on error.
+        """
+        if not self._boundary_buffer:
+            return True
+        try:
+            rows = [
+                {
+                    "zcta_id": zcta_id,
+                    "min_lat": min_lat,
+                    "max_lat": max_lat,
+                    "min_lon": min_lon,
+                    "max_lon": max_lon
+                }
+                for zcta_id, min_lat, max_lat, min_lon, max_lon in self._boundary_buffer
+            ]
+            if self._bulk_session is not None:
+                # Write inside the open bulk transaction; the session owner
+                # commits
+                self._bulk_session.execute(ZCTABoundary.__table__.insert(), rows)
+            else:
+                with self.engine.begin() as conn:
+                    conn.execute(ZCTABoundary.__table__.insert(), rows)
+            self._boundary_buffer.clear()
+            return True
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in flush_boundaries(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in flush_boundaries()")
+        return False
+
+
+    def get_zcta_boundary(self, zcta_id: int):
+        """get points defining boundary box around a zcta
+
+        Args:
+            zcta_id: Foreign key ID of the ZCTA.
+
+        Returns:
+            ZCTABoundary: The ZCTABoundary object, or None if failed.
+        """
+        try:
+            with self.Session() as session:
+                return session.query(ZCTABoundary).filter(ZCTABoundary.zcta_id == zcta_id).all()
+        except SQLAlchemyError as db_error:
+            log.error("SQLAlchemyError in get_zcta_boundary(): %s", db_error)
+        except Exception as e:
+            log.exception("Unexpected error in get_zcta_boundary()")
+        return []
     
\ No newline at end of file
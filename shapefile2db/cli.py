@@ -2,6 +2,7 @@
 
 from shapefile2db.shape_file_exporter import ShapeFileToDB
 from shapefile2db.core import export_shapefile_to_db
+from shapefile2db.address_db.address_constants import VALID_STATES
 from printpop import print_bold, print_red, print_green
 
 def main():
@@ -45,6 +46,11 @@ def main():
                 # Option 2: Export data for a single state
                 print_bold("Enter a two-letter abbreviation for the state:", end='')
                 state = input().strip().upper()
+                # Reject invalid state codes before prompting for (and
+                # loading) a large shapefile
+                if state not in VALID_STATES:
+                    print_red(f"Invalid state abbreviation: '{state}'")
+                    continue
                 print_bold("Enter path and filename of the shapefile (.shp):", end='')
                 shapefile_name = input().strip()
                 print_bold("Enter the name of the database file to export to (.db):", end='')
@@ -15,8 +15,13 @@ https://www.census.gov/geographies/mapping-files/time-series/geo/tiger-line-file
 """
 
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from shapefile2db.shape_file_exporter import ShapeFileToDB
-from shapefile2db.state_shape_file_exporter import StateShapeFileToDB 
+from shapefile2db.state_shape_file_exporter import StateShapeFileToDB
+from shapefile2db.address_db.address_constants import VALID_STATES
 from printpop import print_bold, print_red, print_green
 
 
@@ -43,6 +48,13 @@ def export_shapefile_to_db(state: str = None,
     Raises:
         ValueError: If the provided state is not a valid abbreviation in STATE_ZIP_RANGES.
     """
+    # Fail fast on a bad state code before any shapefile is opened
+    if state and state.upper() not in VALID_STATES:
+        raise ValueError(
+            f"State '{state}' is not a valid state abbreviation. "
+            "Please use a valid two-letter abbreviation (e.g., 'CA', 'TX')."
+        )
+
     if state:
         # Use StateShapeFileToDB for state-specific export
         exporter = StateShapeFileToDB(state=state, 
@@ -59,10 +71,67 @@ def export_shapefile_to_db(state: str = None,
 
     # Get DataFrame from shapefile
     df = exporter.get_df_from_shapefile()
-    
+
+    # get_df_from_shapefile returns False for an empty read (e.g. a state
+    # whose pushdown filter matches no rows); there is nothing to export
+    if df is None or df is False or df.empty:
+        print_red("No data to export.")
+        return False
+
     # Export DataFrame to database
     return exporter.export_shapedf_to_db(zcta_df=df,
                                   digit_max=digit_max,
-                                  point_max=point_max)   
+                                  point_max=point_max)
+
+
+def _export_state(state: str, shape_file_name: str, digit_max: int,
+                  point_max: int) -> bool:
+    """Worker for export_states_to_db: exports one state end to end.
+
+    Module-level so ProcessPoolExecutor can pickle it. Each worker owns its
+    own exporter, shapefile read, and database file, so no SQLite write
+    lock is ever shared between processes.
+    """
+    return export_shapefile_to_db(state=state,
+                                  shape_file_name=shape_file_name,
+                                  digit_max=digit_max,
+                                  point_max=point_max)
+
+
+def export_states_to_db(states, shape_file_name: str = None,
+                        digit_max: int = None, point_max: int = None,
+                        workers: int = None) -> dict:
+    """Exports several states in parallel, one database file per state.
+
+    Each state's filter and export are independent and each worker writes
+    its own default-named database (e.g. 'ca_address.db'), so the states
+    run concurrently across a process pool with no shared SQLite writer.
+
+    Args:
+        states: Iterable of two-letter state abbreviations.
+        shape_file_name (str, optional): Path to the .shp file. If None, uses default.
+        digit_max (int, optional): Max amount of digits for lat and lon
+        point_max (int, optional): Max amount of points for each zcta. Lower number to improve efficiency.
+        workers (int, optional): Pool size. Defaults to os.cpu_count().
+
+    Returns:
+        dict: Maps each state abbreviation to the boolean result of its
+        export.
+
+    Raises:
+        ValueError: If any provided state is not a valid abbreviation.
+    """
+    states = [state.upper() for state in states]
+    invalid = [state for state in states if state not in VALID_STATES]
+    if invalid:
+        raise ValueError(
+            f"Invalid state abbreviations: {invalid}. "
+            "Please use valid two-letter abbreviations (e.g., 'CA', 'TX')."
+        )
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = pool.map(_export_state, states, repeat(shape_file_name),
+                           repeat(digit_max), repeat(point_max))
+        return dict(zip(states, results))
 
 
@@ -47,12 +47,17 @@ Note:
 
 
 # Standard library imports
+import math  # For tolerance estimation when simplifying polygons
 import os  # For file path manipulation, environment variables, or directory operations
+import sys  # For single-write progress output
 import threading  # For concurrent execution or background tasks
-import time  # For delays, timing, or performance measurement
+import time  # Monotonic clock for progress throttling
+from concurrent.futures import ProcessPoolExecutor  # Optional parallel geometry prep
 from datetime import datetime  # For timestamping, logging, or date-based filtering
+from itertools import repeat  # Constant-argument streams for executor.map
 
 # Third-party libraries
+import numpy as np  # For vectorized numeric work on coordinate arrays
 import pandas as pd  # For tabular data manipulation
 import geopandas as gpd  # For geospatial data handling
 from geopandas import GeoDataFrame  # Explicit import for type hinting or subclassing
@@ -64,10 +69,48 @@ from printpop import (
 )  # Styled console output for emphasis or debugging
 
 # Fiona and Pyogrio: used for geospatial file I/O and error handling
+import pyogrio  # Direct C-level shapefile reads
 from pyogrio.errors import DataSourceError  # Raised when reading geospatial files fails
 
 # Project-specific modules
 from shapefile2db.address_db.address_database import AddressDatabase  # Database interface for address-related operations
+from shapefile2db._kernels import prep_ring  # Fused round/dedup/bbox pass per ring
+
+
+def _prep_zcta_geometry(geometry, digit_max, point_max):
+    """Prepares one ZCTA geometry for export: simplify, round, dedup, bbox.
+
+    Module-level so ProcessPoolExecutor workers can pickle it. All the
+    CPU-bound shapely/NumPy work per ZCTA happens here; the caller only
+    stages database rows from the result.
+
+    Args:
+        geometry: A shapely Polygon or MultiPolygon.
+        digit_max (int): Max decimal digits for lat and lon.
+        point_max (int): Max points per ring exterior.
+
+    Returns:
+        list: One (interior, multi, coords, bbox) tuple per ring, exterior
+        ring first for each polygon part, where coords is an (N, 2) float64
+        array and bbox is (min_lat, max_lat, min_lon, max_lon).
+    """
+    multi = isinstance(geometry, shapely.geometry.MultiPolygon)
+    polygons = list(geometry.geoms) if multi else [geometry]
+
+    rings = []
+    for poly in polygons:
+        # reduce poly to under max points
+        poly = ShapeFileToDB.minimize_poly(poly=poly, point_max=point_max)
+
+        ext_cords, ext_bbox = prep_ring(
+            shapely.get_coordinates(poly.exterior), digit_max)
+        rings.append((False, multi, ext_cords, ext_bbox))
+
+        for interior_ring in poly.interiors:
+            int_cords, int_bbox = prep_ring(
+                shapely.get_coordinates(interior_ring), digit_max)
+            rings.append((True, multi, int_cords, int_bbox))
+    return rings
 
 
 class ShapeFileToDB:
@@ -119,11 +162,19 @@ class ShapeFileToDB:
 
     # --- Runtime Configuration ---
     ROW_INCREMENT = 1000
+    COMMIT_INCREMENT = 50000
 
     # --- UI Configuration ---
     LABEL_JUST = 20
     TIMER_JUST = 11
 
+    # Truecolor escapes matching printpop's cyan and orange, for progress
+    # lines that are assembled into a single buffered write instead of
+    # several print calls
+    ANSI_CYAN = "\x1b[38;2;0;255;255m"
+    ANSI_ORANGE = "\x1b[38;2;255;165;0m"
+    ANSI_RESET = "\x1b[0m"
+
     # --- Instance Variables ---
     absolute_file_path = None  # Absolute path to the shapefile
     absolute_db_path = None    # Absolute path to the SQLite database
@@ -131,7 +182,6 @@ class ShapeFileToDB:
     digit_max = DEFAULT_DIGIT_MAX 
     point_max = DEFAULT_POINT_MAX
 
-    timer = False              # Flag for timing operations
     reading = False            # Flag for shapefile reading status
 
     shape_df = None            # DataFrame containing shapefile data
@@ -252,7 +302,8 @@ class ShapeFileToDB:
         This method prints:
         - The shapefile name being read.
         - The start time of the read operation.
-        - A live-updating timer while `self.timer` is True.
+        - A timer refreshed twice per second until `self._read_done` is set,
+          so the thread sleeps in Event.wait instead of spinning at 100Hz.
         - The end time and total number of rows read.
 
         Assumes:
@@ -279,14 +330,16 @@ class ShapeFileToDB:
         timer_str = f"{0:05.2f}"
         print_cyan(timer_str, end="", flush=True)
 
-        # Live timer loop
-        while self.timer:
-            current_time = datetime.now()
-            elapsed_time = current_time - start_time
+        # Live timer loop: wait() blocks until the reader signals done or
+        # the 0.5s refresh interval elapses
+        while not self._read_done.wait(0.5):
+            elapsed_time = datetime.now() - start_time
             total_seconds = elapsed_time.total_seconds()
             timer_str = f"\x1b[5D{total_seconds:05.2f}"  # ANSI escape to overwrite last 5 chars
             print_cyan(timer_str, end="", flush=True)
-            time.sleep(0.01)
+
+        elapsed_time = datetime.now() - start_time
+        timer_str = f"\x1b[5D{elapsed_time.total_seconds():05.2f}"
 
         # Final timer display
         print_orange(timer_str, flush=True, end="")
@@ -308,92 +361,114 @@ class ShapeFileToDB:
         """Reads the shapefile in chunks and stores the data in a GeoDataFrame.
 
         This method:
-        - Initializes an empty GeoDataFrame (`self.shape_df`).
         - Reads the shapefile incrementally using `self.ROW_INCREMENT` to avoid memory overload.
-        - Appends each chunk to `self.shape_df`.
+        - Reads each chunk directly with pyogrio (skip_features/max_features)
+          rather than gpd.read_file row slicing, so every chunk is a single
+          driver call instead of a scan-and-slice.
+        - Applies the same column subset and _read_where row filter as the
+          default single-call read, so both modes return identical data.
+        - Collects each chunk in a list and concatenates once at the end,
+          so the total bytes copied stay linear in the file size instead of
+          re-copying the accumulated frame on every chunk.
         - Stops reading when no more data is available.
-        - Updates `self.reading` and `self.timer` flags accordingly.
+        - Sets `self.shape_df` and signals `self._read_done` when finished.
 
         Assumes:
             - `self.absolute_file_path` is a valid path to a shapefile.
             - `self.ROW_INCREMENT` defines the number of rows per read cycle.
-            - `self.reading` and `self.timer` are control flags for external timing and status.
+            - `self.reading` is the loop control flag; `self._read_done` wakes
+              the timer thread.
         """
         current_row = 0
+        chunks = []
         self.shape_df = gpd.GeoDataFrame()
 
         while self.reading:
-            # Read a chunk of rows from the shapefile
-            gdf_temp = gpd.read_file(
+            # Read a chunk of rows from the shapefile; OGR evaluates the
+            # where clause first, so skip_features pages through the
+            # filtered rows consistently across calls
+            gdf_temp = pyogrio.read_dataframe(
                 self.absolute_file_path,
-                rows=slice(current_row, current_row + self.ROW_INCREMENT)
+                columns=[self.ZIP_FIELD, self.ZIP_LAT_FIELD, self.ZIP_LON_FIELD,
+                         self.ZIP_CLASS_FIELD, self.ZIP_FEATURE_FIELD,
+                         self.ZIP_STATUS_FIELD],
+                where=self._read_where(),
+                skip_features=current_row,
+                max_features=self.ROW_INCREMENT
             )
 
             if gdf_temp.empty:
-                # No more data to read; stop reading and timer
+                # No more data to read
                 self.reading = False
-                self.timer = False
             else:
-                # Append the chunk to the main DataFrame
-                self.shape_df = pd.concat([self.shape_df, gdf_temp], ignore_index=True)
+                # Collect the chunk; concatenation happens once at the end
+                chunks.append(gdf_temp)
                 current_row += self.ROW_INCREMENT
 
-                # Yield control to timer loop without significant delay
-                time.sleep(0.01)
+        if chunks:
+            self.shape_df = gpd.GeoDataFrame(
+                pd.concat(chunks, ignore_index=True), crs=chunks[0].crs
+            )
+
+        # Signal the timer only after the frame is assembled so the timer
+        # thread reports the final row count
+        self._read_done.set()
 
 
 
     def filter_df(self, df, sort_column):
-        """Sorts a DataFrame by the specified column and prints timing information.
+        """Returns the DataFrame unchanged; hook for subclass filtering.
+
+        The all-states export used to sort here by ZIP, but nothing
+        downstream depends on row order: every ZCTA is exported
+        independently and ids are assigned by the database layer, so the
+        sort was pure overhead. Subclasses (StateShapeFileToDB) override
+        this to do their actual filtering. If ordered output is ever needed
+        again, argsort the key column and reindex with df.iloc[order]
+        rather than sort_values, which drags the geometry column through
+        the sort.
 
         Args:
-            df (pd.DataFrame): The DataFrame to be sorted.
-            sort_column (str): The column name to sort by.
+            df (pd.DataFrame): The DataFrame read from the shapefile.
+            sort_column (str): Unused in the base class; kept for the
+                subclass signature.
 
         Returns:
-            pd.DataFrame: A new DataFrame sorted by the specified column.
+            pd.DataFrame: The input DataFrame, unmodified.
+        """
+        return df
 
-        Side Effects:
-            - Prints the start and end time of the sort operation.
-            - Displays the total number of rows in the original DataFrame.
-            - Uses custom color functions `print_cyan()` and `print_orange()` for output.
+    
+           
+    def _read_where(self) -> str:
+        """Returns the OGR attribute filter applied during the default read.
 
-        Assumes:
-            - `self.LABEL_JUST` and `self.TIMER_JUST` control label and time formatting.
-            - `print_cyan()` and `print_orange()` are available for styled console output.
+        Subclasses can extend the clause to push their own row predicates
+        into the C-level read (see StateShapeFileToDB), so excluded rows
+        are never decoded into the DataFrame at all.
         """
-        print()
+        return (
+            f"{self.ZIP_CLASS_FIELD} = '{self.ZIP_CLASS}' AND "
+            f"{self.ZIP_FEATURE_FIELD} = '{self.ZIP_FEATURE_CODE}' AND "
+            f"{self.ZIP_STATUS_FIELD} = '{self.ZIP_STATUS}'"
+        )
 
-        # Record and display start time
-        # start_time = datetime.now()
-        # formatted_start = start_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
-        # print("Sort Start:".ljust(self.LABEL_JUST), end="", flush=True)
-        # print_cyan(formatted_start)
-
-        # Perform the sort
-        df_sorted = df.sort_values(by=sort_column)
-        # df_sorted = df.drop_duplicates(keep='last')
-        # Record and display end time
-        # end_time = datetime.now()
-        # formatted_end = end_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
-        # print("Sort End:".ljust(self.LABEL_JUST), end="", flush=True)
-        # print_orange(formatted_end)
 
-        # # Display total row count
-        # print("Total Rows:".ljust(self.LABEL_JUST), end="", flush=True)
-        # print_orange(str(len(df)))
-        # print()
 
-        return df_sorted
+    def get_df_from_shapefile(self, shape_file_path: str = None,
+                              chunked: bool = False) -> GeoDataFrame:
+        """Reads a shapefile into a GeoDataFrame.
 
-    
-           
-    def get_df_from_shapefile(self, shape_file_path: str = None) -> GeoDataFrame:
-        """Reads a shapefile into a GeoDataFrame using threaded read and timer operations.
+        By default the whole layer is read with a single pyogrio call, which
+        streams records in C. The old chunked read re-opened the file and
+        re-parsed the header once per 1000 rows while a second thread spun
+        to render a timer; it remains available via chunked=True for
+        machines that cannot hold the file in memory alongside the read.
 
         Args:
             shape_file_path (str, optional): Absolute path to the shapefile.
                 If None, uses the path provided during class initialization.
+            chunked (bool): If True, fall back to the threaded chunked read.
 
         Returns:
             GeoDataFrame: A sorted GeoDataFrame containing ZIP code data.
@@ -401,13 +476,13 @@ class ShapeFileToDB:
             False: If the shapefile is found but contains no data.
 
         Side Effects:
-            - Starts two threads: one for reading the shapefile and one for displaying a timer.
             - Sets `self.shape_df` with the loaded data.
+            - Prints read timing and row-count information.
             - Prints error messages using `print_red()` if exceptions occur.
 
         Raises:
             FileNotFoundError: If the shapefile path is invalid.
-            DataSourceError: If geopandas fails to read the file.
+            DataSourceError: If pyogrio fails to read the file.
             Exception: For any other unexpected errors.
         """
         try:
@@ -415,20 +490,51 @@ class ShapeFileToDB:
             if shape_file_path is None:
                 shape_file_path = self.absolute_file_path
 
-            # Initialize threads for reading and timing
-            timer_thread = threading.Thread(target=self._read_timer)
-            read_thread = threading.Thread(target=self._read_shape_file)
+            if chunked:
+                # Initialize threads for reading and timing; the event lets
+                # the timer thread sleep until the reader finishes
+                self._read_done = threading.Event()
+                timer_thread = threading.Thread(target=self._read_timer)
+                read_thread = threading.Thread(target=self._read_shape_file)
 
-            # Start threads
-            self.timer = True
-            timer_thread.start()
+                # Start threads
+                timer_thread.start()
 
-            self.reading = True
-            read_thread.start()
+                self.reading = True
+                read_thread.start()
 
-            # Wait for both threads to finish
-            read_thread.join()
-            timer_thread.join()
+                # Wait for both threads to finish
+                read_thread.join()
+                timer_thread.join()
+            else:
+                # Single C-level read of the whole layer; no per-chunk
+                # file reopen and no timer thread to contend with
+                print()
+                print("Shape File:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_cyan(os.path.basename(shape_file_path))
+
+                start_time = datetime.now()
+                formatted_start = start_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
+                print("Read Start:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_cyan(formatted_start)
+
+                # Only the columns the export uses are materialized, and the
+                # row filter runs inside OGR during the read instead of over
+                # a full DataFrame afterwards. Columns referenced by the
+                # where clause must be in the subset.
+                self.shape_df = pyogrio.read_dataframe(
+                    shape_file_path,
+                    columns=[self.ZIP_FIELD, self.ZIP_LAT_FIELD, self.ZIP_LON_FIELD,
+                             self.ZIP_CLASS_FIELD, self.ZIP_FEATURE_FIELD,
+                             self.ZIP_STATUS_FIELD],
+                    where=self._read_where()
+                )
+
+                elapsed = (datetime.now() - start_time).total_seconds()
+                print("Read Timer:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_orange(f"{elapsed:05.2f}")
+                print("Total Rows:".ljust(self.LABEL_JUST), end="", flush=True)
+                print_orange(str(len(self.shape_df)))
 
             # Retrieve the loaded DataFrame
             zipcode_df = self.shape_df
@@ -493,25 +599,56 @@ class ShapeFileToDB:
     #             seen.add(item)
     #     return unique_tuples
 
-    def minimize_poly(self, poly, point_max):
-        # Add exterior boundary points
-        tolerance = 0
-        cord_list = list(poly.exterior.coords)
-        while len(cord_list) > point_max:
-            poly = simplify(poly, tolerance=tolerance, preserve_topology=True)
-            cord_list = list(poly.exterior.coords)
-            tolerance = tolerance + 0.0001
-        return poly
+    @staticmethod
+    def minimize_poly(poly, point_max):
+        """Reduces a polygon's exterior to at most point_max points.
+
+        Estimates a starting tolerance from the polygon's extent and point
+        budget, then doubles it until the simplified exterior fits. That is
+        a handful of GEOS simplify calls per polygon instead of stepping
+        the tolerance linearly from zero, and the point count is read with
+        count_coordinates rather than materializing the coords as a list.
+
+        Args:
+            poly (Polygon): The polygon to simplify.
+            point_max (int): Max number of exterior points to keep.
+
+        Returns:
+            Polygon: The simplified polygon (the original if already small
+            enough, or the closest fit after the tolerance search).
+        """
+        point_count = shapely.count_coordinates(poly.exterior)
+        if point_count <= point_max:
+            return poly
+
+        # Seed the tolerance from the bounding-box diagonal scaled by the
+        # point budget; preserve_topology guards against collapsing rings
+        min_x, min_y, max_x, max_y = poly.bounds
+        diag = math.hypot(max_x - min_x, max_y - min_y)
+        tolerance = max(diag * math.sqrt(point_max / point_count) / 16, 1e-9)
+
+        simplified = poly
+        for _ in range(32):
+            simplified = simplify(poly, tolerance=tolerance, preserve_topology=True)
+            if shapely.count_coordinates(simplified.exterior) <= point_max:
+                break
+            tolerance *= 2
+        return simplified
     
     
 
-    def export_shapedf_to_db(self, zcta_df, digit_max, point_max) -> bool:
+    def export_shapedf_to_db(self, zcta_df, digit_max, point_max, workers: int = None) -> bool:
         """Exports ZIP code and ZCTA boundary data from a GeoDataFrame to a SQLite database.
 
         Args:
             zcta_df (GeoDataFrame): DataFrame containing ZIP code geometries and metadata.
             digit_max (int, optional): Max amount of digits for lat and lon
             point_max (int, optional): Max amount of points for each zcta. Lower number to improve efficiency.
+            workers (int, optional): If greater than 1, spread the per-ZCTA
+                geometry preparation (simplify, round, bbox) over this many
+                processes. Database writes stay in this process since SQLite
+                writers must be serialized. Worker errors abort the export,
+                unlike the serial path which skips the failing row.
         Returns:
             bool: True if export completes successfully, False if the input is empty.
 
@@ -526,16 +663,22 @@ class ShapeFileToDB:
             - `print_cyan()` and `print_orange()` are available for styled console output.
         """
         current_row = 0
+        total_rows = len(zcta_df)
         start_time = datetime.now()
-        current_time = datetime.now()
-        
+        start_tick = time.monotonic()
+        last_tick = start_tick
+
         if digit_max is None:
             digit_max = self.digit_max
         if point_max is None:
             point_max = self.point_max
 
-        # Connect to or create the database
-        address_db = AddressDatabase(db_absolute_path=self.absolute_db_path)
+        # Connect to or create the database. Boundary rows are buffered in
+        # memory until the bulk session exits; point rows accumulate across
+        # rings and are written 10k at a time.
+        address_db = AddressDatabase(db_absolute_path=self.absolute_db_path,
+                                     buffer_boundaries=True,
+                                     buffer_points=True)
 
         # Display database file name
         print("Database File:".ljust(self.LABEL_JUST), end="", flush=True)
@@ -544,7 +687,7 @@ class ShapeFileToDB:
 
         # Display total rows to export
         print("Rows to Export:".ljust(self.LABEL_JUST), end="", flush=True)
-        print_cyan(str(len(zcta_df)))
+        print_cyan(str(total_rows))
 
         # Display export start time
         formatted_start = start_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
@@ -553,90 +696,114 @@ class ShapeFileToDB:
 
         # Initialize export progress display
         self._print_time_remaining(rows_done=current_row,
-                                    total_rows=len(zcta_df),
-                                    start_time=start_time,
+                                    total_rows=total_rows,
+                                    start_tick=start_tick,
                                     overwrite=False)
 
 
-        for _, row in zcta_df.iterrows():
-            zip_code = row[self.ZIP_FIELD]
-            zip_lat = round(float(row[self.ZIP_LAT_FIELD]), digit_max)
-            zip_lon = round(float(row[self.ZIP_LON_FIELD]), digit_max)
-            zip_geometry = row[self.ZIP_GEOMETRY_FIELD]
-
-            # Add ZIP code entry
-            zip_obj = address_db.add_zip(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
-
-            if zip_obj is not None:
-                try:
-                    # Determine if geometry is a MultiPolygon
-                    polygons = list(zip_geometry.geoms) if isinstance(zip_geometry, shapely.geometry.MultiPolygon) else [zip_geometry]
-                    multi = isinstance(zip_geometry, shapely.geometry.MultiPolygon)
-
-                    poly_lat_high = None
-                    poly_lat_low = None
-                    poly_lon_high = None
-                    poly_long_low = None
-
-                    for poly in polygons:
-                        # reduce poly to under max points
-                        poly = self.minimize_poly(poly=poly, point_max=point_max)
-
-                        # Add ZCTA entry for exterior
-                        zcta_obj = address_db.add_zcta(zip_code_id=zip_obj.zip_code_id, interior=False, multi=multi)
+        # Extract each column once as a plain array; iterating zipped scalars
+        # avoids materializing a pandas Series per row in the hot loop
+        zips = zcta_df[self.ZIP_FIELD].to_numpy()
+        zip_lats = np.round(zcta_df[self.ZIP_LAT_FIELD].to_numpy(dtype=np.float64), digit_max)
+        zip_lons = np.round(zcta_df[self.ZIP_LON_FIELD].to_numpy(dtype=np.float64), digit_max)
+        geometries = zcta_df[self.ZIP_GEOMETRY_FIELD].to_numpy()
+
+        # Pre-simplify the whole geometry column in one GEOS batch call.
+        # Geometries over the point budget get a tolerance seeded the same
+        # way minimize_poly seeds its search (bbox diagonal scaled by the
+        # point budget), so the per-polygon search afterwards starts from an
+        # already-reduced ring and usually finishes in one or two calls.
+        counts = shapely.get_num_coordinates(geometries)
+        if counts.size and counts.max() > point_max:
+            bounds = shapely.bounds(geometries)
+            diag = np.hypot(bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1])
+            tols = np.where(
+                counts > point_max,
+                diag * np.sqrt(point_max / np.maximum(counts, 1)) / 16,
+                0.0
+            )
+            geometries = shapely.simplify(geometries, tols, preserve_topology=True)
+
+        # Optional parallel geometry prep: workers run _prep_zcta_geometry
+        # over the geometry column while this process stays the sole SQLite
+        # writer, consuming prepped rings in order
+        pool = None
+        if workers and workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            ring_results = pool.map(_prep_zcta_geometry, geometries,
+                                    repeat(digit_max), repeat(point_max),
+                                    chunksize=64)
+        else:
+            ring_results = geometries
 
-                        # Add exterior boundary points
-                        ext_cord_list = list(poly.exterior.coords)
+        # One transaction for the whole export: per-row commits each paid an
+        # fsync, which dominated runtime on the points table. Checkpoint
+        # commits every COMMIT_INCREMENT rows bound WAL growth on full runs.
+        # Buffered point and boundary rows are drained on session exit.
+        try:
+            with address_db.bulk_session() as session:
+                for zip_code, zip_lat, zip_lon, geom_or_rings in zip(
+                        zips.tolist(), zip_lats.tolist(), zip_lons.tolist(), ring_results):
+                    try:
+                        # Stage ZIP code entry with a pre-assigned id; the row
+                        # is written in batch by flush_staged()
+                        zip_code_id = address_db.stage_zip(zip_code=zip_code, zip_lat=zip_lat, zip_lon=zip_lon)
+
+                        # Rings arrive prepped from the pool, or are prepped
+                        # inline on the serial path
+                        if pool is None:
+                            rings = _prep_zcta_geometry(geom_or_rings, digit_max, point_max)
+                        else:
+                            rings = geom_or_rings
+
+                        for interior, multi, ring_cords, ring_bbox in rings:
+                            ring_zcta_id = address_db.stage_zcta(
+                                zip_code_id=zip_code_id, interior=interior, multi=multi)
+                            min_lat, max_lat, min_lon, max_lon = ring_bbox
+
+                            address_db.add_all_zcta_points(zcta_id=ring_zcta_id, zcta_points=ring_cords)
+                            # Each ring's bbox row references that ring's own
+                            # zcta_id; interior bboxes used to be attached to
+                            # the preceding exterior ring's id
+                            address_db.add_zcta_boundary(zcta_id=ring_zcta_id,
+                                                         min_lat=min_lat,
+                                                         max_lat=max_lat,
+                                                         min_lon=min_lon,
+                                                         max_lon=max_lon)
+
+                    except Exception as e:
+                        print_red(f"Unexpected error in export_shapedf_to_db(): {type(e).__name__}: {e}")
+                        # A failed flush (e.g. duplicate ZIP on re-export)
+                        # leaves the transaction unusable; roll back so later
+                        # rows can proceed. Geometry errors keep the session
+                        # active and lose only this row, as before.
+                        if not session.is_active:
+                            session.rollback()
+
+                    # Update export progress
+                    current_row += 1
+                    if current_row % self.COMMIT_INCREMENT == 0:
+                        address_db.flush_staged()
+                        session.commit()
+                    # time.monotonic is a cheap float read, unlike the two
+                    # datetime.now calls this throttle check used to make
+                    now = time.monotonic()
+                    if now - last_tick > 0.5:
+                        self._print_time_remaining(rows_done=current_row,
+                                                    total_rows=total_rows,
+                                                    start_tick=start_tick,
+                                                    overwrite=True)
+                        last_tick = now
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
-                        # round to max digits for cords
-                        ext_cord_list = [(round(val1, digit_max), round(val2, digit_max)) for val1, val2 in ext_cord_list]
-        
-                        address_db.add_all_zcta_points(zcta_id=zcta_obj.zcta_id, zcta_points=ext_cord_list)
-
-                        # get max / min lat and lon for bounding box and add
-                        ext_lats, ext_lons = zip(*ext_cord_list)
-                        zcta_boundary = address_db.add_zcta_boundary(zcta_id=zcta_obj.zcta_id, 
-                                                                     min_lat=min(ext_lats),
-                                                                     max_lat=max(ext_lats),
-                                                                     min_lon=min(ext_lons),
-                                                                     max_lon=max(ext_lons))
-
-                        # Add interior boundary points (if any)
-                        for interior_ring in poly.interiors:
-                            zcta_int_obj = address_db.add_zcta(zip_code_id=zip_obj.zip_code_id, interior=True, multi=multi)
-                            interior_coord_list = list(interior_ring.coords)
-                            interior_coord_list = [(round(val1, self.digit_max), round(val2, self.digit_max)) for val1, val2 in interior_coord_list]
-                        
-                            # interior_coord_list = self.filter_list(the_list = interior_coord_list, digit_max = self.digit_max, point_max = self.point_max)
-                            address_db.add_all_zcta_points(zcta_id=zcta_int_obj.zcta_id, zcta_points=interior_coord_list)
-
-                            int_lats, int_lons = zip(*interior_coord_list)
-                            zcta_int_boundary = address_db.add_zcta_boundary(zcta_id=zcta_obj.zcta_id, 
-                                                                     min_lat=min(int_lats),
-                                                                     max_lat=max(int_lats),
-                                                                     min_lon=min(int_lons),
-                                                                     max_lon=max(int_lons))
-
-                except Exception as e:
-                    print_red(f"Unexpected error in export_shapedf_to_db(): {type(e).__name__}: {e}")
-
-            # Update export progress
-            current_row += 1
-            time_delta = datetime.now() - current_time
-            if time_delta.total_seconds() > 0.5:
-                self._print_time_remaining(rows_done=current_row,
-                                            total_rows=len(zcta_df),
-                                            start_time=start_time,
-                                            overwrite=True)
-                current_time = datetime.now()
-                
         # Final export status
         self._print_time_remaining(rows_done=current_row,
-                                    total_rows=len(zcta_df),
-                                    start_time=start_time,
+                                    total_rows=total_rows,
+                                    start_tick=start_tick,
                                     overwrite=True)
-        current_time = datetime.now()
-        
+
         # Display export end time
         formatted_end = datetime.now().strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
         print()
@@ -646,31 +813,36 @@ class ShapeFileToDB:
 
         return True
 
-    def _print_time_remaining(self, rows_done: int, total_rows: int, start_time: datetime, overwrite: bool = False) -> None:
+    def _print_time_remaining(self, rows_done: int, total_rows: int, start_tick: float, overwrite: bool = False) -> None:
         """Prints the estimated time remaining for a database export operation.
-        """
-        if overwrite:
-            print("\r", end="")
-        print("Rows Exported:".ljust(self.LABEL_JUST), end="", flush=True)
-        row_str = f"{str(rows_done).ljust(self.TIMER_JUST)}"
-        print_cyan(row_str, end="", flush=True)
 
-        print("Time Remaining:".ljust(self.LABEL_JUST), end="", flush=True)
+        The whole status line is assembled into one string and written with
+        a single flushed stdout write, instead of one flushed print per
+        label and value.
+        """
         time_remaining = self._get_time_remaining(rows_done=rows_done,
                                                     total_rows=total_rows,
-                                                    start_time=start_time)
-        remaining_str = f"{str(time_remaining).ljust(self.TIMER_JUST)}"
-        print_cyan(remaining_str, end="", flush=True)
+                                                    start_tick=start_tick)
+        prefix = "\r" if overwrite else ""
+        line = (
+            f"{prefix}"
+            f"{'Rows Exported:'.ljust(self.LABEL_JUST)}"
+            f"{self.ANSI_CYAN}{str(rows_done).ljust(self.TIMER_JUST)}{self.ANSI_RESET}"
+            f"{'Time Remaining:'.ljust(self.LABEL_JUST)}"
+            f"{self.ANSI_CYAN}{str(time_remaining).ljust(self.TIMER_JUST)}{self.ANSI_RESET}"
+        )
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 
-    def _get_time_remaining(self, rows_done: int, total_rows: int, start_time: datetime) -> str:
+    def _get_time_remaining(self, rows_done: int, total_rows: int, start_tick: float) -> str:
         """Estimates the remaining time for a database export operation.
 
         Args:
             rows_done (int): Number of rows already processed.
             total_rows (int): Total number of rows to process.
-            start_time (datetime): Timestamp when the export began.
+            start_tick (float): time.monotonic() reading when the export began.
 
         Returns:
             str: Estimated time remaining in HH:MM:SS format.
@@ -683,8 +855,7 @@ class ShapeFileToDB:
             return "00:00:00"
 
         rows_left = total_rows - rows_done
-        time_lapsed = datetime.now() - start_time
-        elapsed_seconds = time_lapsed.total_seconds()
+        elapsed_seconds = time.monotonic() - start_tick
 
         # Estimate remaining time
         time_left = (rows_left / rows_done) * elapsed_seconds
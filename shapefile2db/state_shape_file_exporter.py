@@ -8,11 +8,18 @@ Use this class when exporting data for one state only. For all-state exports,
 use ShapeFileToDB.
 """
 
-from shapefile2db.shape_file_exporter import ShapeFileToDB
-from shapefile2db.address_db.address_constants import STATE_ZIP_RANGES
+import sys
 from datetime import datetime
+
+import numpy as np
+import pandas as pd
 from printpop import print_lime, print_cyan, print_orange, print_red
-from functools import reduce
+
+from shapefile2db.shape_file_exporter import ShapeFileToDB
+from shapefile2db.address_db.address_constants import (
+    STATE_ZIP_RANGES, STATE_ZIP_RANGES_INT
+)
+from shapefile2db._kernels import range_mask
 
 
 class StateShapeFileToDB(ShapeFileToDB):
@@ -61,6 +68,23 @@ class StateShapeFileToDB(ShapeFileToDB):
         self.state = state.upper()
         self.zip_ranges_list = STATE_ZIP_RANGES.get(self.state)
 
+        # Pack the state's ZIP ranges into sorted int32 bound arrays once;
+        # filter_df probes these on every call and they never change.
+        # Overlapping or adjacent ranges (VA lists both 20040-20041 and
+        # 20040-20167) are merged first — range_mask's single binary-search
+        # probe only checks one candidate range per value, so the ranges it
+        # sees must be disjoint
+        merged = []
+        for low, high in sorted(STATE_ZIP_RANGES_INT[self.state]):
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], high)
+            else:
+                merged.append([low, high])
+        self._lows = np.fromiter(
+            (low for low, _ in merged), dtype=np.int32, count=len(merged))
+        self._highs = np.fromiter(
+            (high for _, high in merged), dtype=np.int32, count=len(merged))
+
         if database_name is None:
             # Default database name: e.g., 'ca_address.db'
             database_name = f"{self.state.lower()}{self.DB_BASE}"
@@ -73,6 +97,24 @@ class StateShapeFileToDB(ShapeFileToDB):
 
 
 
+    def _read_where(self):
+        """Extends the read filter with this state's ZIP code ranges.
+
+        Pushing the range predicate into OGR means rows outside the state
+        are never decoded during the read — for a single state that skips
+        roughly 98% of the national file's geometry parsing. The ranges
+        are zero-padded 5-digit strings, so the string comparisons OGR
+        runs match the numeric ranges exactly. filter_df still re-checks
+        rows afterwards, which keeps directly-passed DataFrames working.
+        """
+        ranges = " OR ".join(
+            f"({self.ZIP_FIELD} >= '{low}' AND {self.ZIP_FIELD} <= '{high}')"
+            for low, high in self.zip_ranges_list
+        )
+        return f"{super()._read_where()} AND ({ranges})"
+
+
+
     def filter_df(self, df, sort_column=None):
         """Filters and sorts a DataFrame by ZIP code ranges for the specified state.
 
@@ -86,41 +128,56 @@ class StateShapeFileToDB(ShapeFileToDB):
         Side Effects:
             - Prints start and end timestamps of the filtering operation.
             - Displays total row count after filtering.
-            - Uses styled console output via print_cyan() and print_orange().
+            - Writes each styled status line as one buffered stdout write.
 
         Assumes:
             - `self.ZIP_FIELD` is defined in the parent class.
             - `self.LABEL_JUST` and `self.TIMER_JUST` control output formatting.
         """
-        # Build list of filters for each ZIP code range
-        filter_list = []
-        for zip_range in self.zip_ranges_list:
-            low_zip_filter = df[self.ZIP_FIELD] >= zip_range[0]
-            high_zip_filter = df[self.ZIP_FIELD] <= zip_range[1]
-            filter_list.append(low_zip_filter & high_zip_filter)
-
-        # Combine all filters using bitwise OR
-        combined_filter = reduce(lambda x, y: x | y, filter_list)
-
-        # Record and print start time
+        # Convert the ZIP strings to a contiguous int32 buffer once, so the
+        # range probe below is a typed compare instead of per-element Python
+        # string comparisons. Non-numeric codes (none in census data, but
+        # coerce guards against bad rows) are dropped before the cast.
+        zip_col = pd.to_numeric(df[self.ZIP_FIELD], errors='coerce')
+        valid = zip_col.notna().to_numpy()
+        if not valid.all():
+            df = df[valid]
+            zip_col = zip_col[valid]
+        # One searchsorted probe per row against the precomputed sorted
+        # range bounds replaces a boolean mask per range OR-ed together
+        zips = zip_col.to_numpy(dtype=np.int32)
+        combined_filter = range_mask(zips, self._lows, self._highs)
+
+        # Record and print start time as one buffered write, matching the
+        # exporter's single-write progress lines
         start_time = datetime.now()
         formatted_start = start_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
-        print(f"Filter '{self.state}' Start:".ljust(self.LABEL_JUST), end="", flush=True)
-        print_cyan(formatted_start)
-
-        # Apply filter and sort
-        filtered_df = df[combined_filter]
+        sys.stdout.write(
+            f"Filter '{self.state}' Start:".ljust(self.LABEL_JUST)
+            + f"{self.ANSI_CYAN}{formatted_start}{self.ANSI_RESET}\n"
+        )
+
+        # Filter and sort in a single take: reorder the surviving row
+        # positions by the int32 key first, then copy the frame once. The
+        # old df[mask] followed by a sort copied every selected row twice,
+        # geometry column included
+        positions = np.nonzero(combined_filter)[0]
         sort_column = sort_column or self.ZIP_FIELD
-        df_sorted = filtered_df.sort_values(by=sort_column)
+        if sort_column == self.ZIP_FIELD:
+            order = np.argsort(zips[positions], kind='stable')
+            df_sorted = df.take(positions[order])
+        else:
+            df_sorted = df.take(positions).sort_values(by=sort_column)
 
-        # Record and print end time
+        # Print end time and total row count together in one write
         end_time = datetime.now()
         formatted_end = end_time.strftime("%H:%M:%S:%f")[:self.TIMER_JUST]
-        print("Filter End:".ljust(self.LABEL_JUST), end="", flush=True)
-        print_orange(formatted_end)
-
-        # Print total row count
-        print(f"Total '{self.state}' Rows:".ljust(self.LABEL_JUST), end="", flush=True)
-        print_orange(str(len(df_sorted)))
+        sys.stdout.write(
+            "Filter End:".ljust(self.LABEL_JUST)
+            + f"{self.ANSI_ORANGE}{formatted_end}{self.ANSI_RESET}\n"
+            + f"Total '{self.state}' Rows:".ljust(self.LABEL_JUST)
+            + f"{self.ANSI_ORANGE}{len(df_sorted)}{self.ANSI_RESET}\n"
+        )
+        sys.stdout.flush()
 
         return df_sorted
\ No newline at end of file
@@ -1,22 +1,24 @@
+from pathlib import Path
+
 from shapefile2db import StateShapeFileToDB, ShapeFileToDB, export_shapefile_to_db
 from printpop import print_lime
 from datetime import datetime
 
 print_lime("Test - Starting Export")
-shapeFilePath = "tl_2020_us_zcta520.shp"
-databasepath = "ca_zcta.db"
+shapeFilePath = Path("tl_2020_us_zcta520.shp")
+databasepath = Path("ca_zcta.db")
 state = "CA"
 digit_max = 4
 point_max = 100
 
-# result = export_shapefile_to_db(state=state, 
-#                                 shape_file_name=shapeFilePath, 
-#                                 database_name=databasepath, 
-#                                 digit_max=digit_max, 
+# result = export_shapefile_to_db(state=state,
+#                                 shape_file_name=shapeFilePath,
+#                                 database_name=databasepath,
+#                                 digit_max=digit_max,
 #                                 point_max=point_max)
 # print_lime("Result:", result)
 # export_shapefile_to_db(shape_file_name='tl_2020_us_zcta520.shp', database_name=f'zcta-{datetime.now().strftime("%Y%m%d%H%M%S")}.db')
 
 # from shapefile2db import export_shapefile_to_db
 
-export_shapefile_to_db(state='NM', shape_file_name="tl_2020_us_zcta520.shp", database_name="nm_zcta.db")
\ No newline at end of file
+export_shapefile_to_db(state='NM', shape_file_name=Path("tl_2020_us_zcta520.shp"), database_name=Path("nm_zcta.db"))
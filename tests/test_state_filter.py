@@ -0,0 +1,60 @@
+"""Regression tests for the state ZIP-range filter.
+
+The searchsorted filter in StateShapeFileToDB.filter_df probes one
+candidate range per ZIP, so the bound arrays it is given must cover the
+same ZIP space as the raw STATE_ZIP_RANGES tables — including states
+whose published ranges overlap (VA lists 20040-20041 inside 20040-20167).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shapefile2db.address_db.address_constants import (
+    STATE_ZIP_RANGES, STATE_ZIP_RANGES_INT
+)
+from shapefile2db.state_shape_file_exporter import StateShapeFileToDB
+
+
+@pytest.fixture
+def make_exporter(tmp_path):
+    """Builds a state exporter against a placeholder shapefile.
+
+    filter_df never touches the file; the empty .shp/.shx/.dbf trio only
+    satisfies the path validation in __init__.
+    """
+    def _make(state):
+        for suffix in (".shp", ".shx", ".dbf"):
+            (tmp_path / f"dummy{suffix}").touch()
+        return StateShapeFileToDB(state=state,
+                                  shape_file_name=str(tmp_path / "dummy.shp"),
+                                  database_name=str(tmp_path / "t.db"))
+    return _make
+
+
+def _expected_mask(state, zips):
+    """ORs the raw per-range masks — the baseline the filter must match."""
+    expected = np.zeros(zips.shape, dtype=bool)
+    for low, high in STATE_ZIP_RANGES_INT[state]:
+        expected |= (zips >= low) & (zips <= high)
+    return expected
+
+
+def test_filter_keeps_zips_in_overlapping_va_ranges(make_exporter):
+    # 20100 and 20166 fall only in the wider 20040-20167 range, which the
+    # unmerged searchsorted probe skipped in favor of 20040-20041
+    exporter = make_exporter("VA")
+    df = pd.DataFrame({exporter.ZIP_FIELD: ["20040", "20100", "20166", "22301", "19999"]})
+    kept = list(exporter.filter_df(df)[exporter.ZIP_FIELD])
+    assert kept == ["20040", "20100", "20166", "22301"]
+
+
+def test_filter_matches_per_range_masks_for_every_state(make_exporter):
+    zips = np.arange(1, 100000)
+    codes = [f"{z:05d}" for z in zips]
+    for state in STATE_ZIP_RANGES:
+        exporter = make_exporter(state)
+        df = pd.DataFrame({exporter.ZIP_FIELD: codes})
+        kept = exporter.filter_df(df)[exporter.ZIP_FIELD].to_numpy().astype(np.int64)
+        expected = zips[_expected_mask(state, zips)]
+        assert np.array_equal(np.sort(kept), expected), state